@@ -3,7 +3,7 @@ Catalog Filter Module
 Filters catalogs based on user selection from saved_catalogs config.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import FrozenSet, Iterator, List, Dict, Any
 from catalog_id_utils import get_catalog_id_part
 
 
@@ -24,15 +24,24 @@ class CatalogFilter:
         """
         self.saved_catalogs = saved_catalogs
 
-        # Build lookup for enabled catalogs by catalog_id
-        self.enabled_catalog_ids = set()
+        # The enabled set never changes after init, so it's a frozenset
+        self.enabled_catalog_ids: FrozenSet[str] = frozenset(self._build_enabled(saved_catalogs))
+
+    def _build_enabled(self, saved_catalogs: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Yield the catalog_id of each enabled saved catalog.
+
+        Args:
+            saved_catalogs: List of catalog dicts from config with 'enabled' flags
+
+        Yields:
+            catalog_id of each enabled catalog
+        """
         for cat in saved_catalogs:
-            if cat.get('enabled', False):
-                # Extract catalog_id from full id (format: "addon_url|catalog_id|catalog_type")
-                full_id = cat.get('id', '')
-                catalog_id = get_catalog_id_part(full_id)
-                if catalog_id:
-                    self.enabled_catalog_ids.add(catalog_id)
+            # Full id format: "addon_url|catalog_id|catalog_type"
+            # (get_catalog_id_part is cached and parses with str.partition)
+            if cat.get('enabled', False) and (catalog_id := get_catalog_id_part(cat.get('id', ''))):
+                yield catalog_id
 
     def is_catalog_enabled(self, catalog_id: str) -> bool:
         """
@@ -56,12 +65,10 @@ class CatalogFilter:
         Returns:
             Filtered list containing only enabled catalogs
         """
-        filtered = []
-        for catalog in catalogs:
-            catalog_id = catalog.get('id', '')
-            if self.is_catalog_enabled(catalog_id):
-                filtered.append(catalog)
-        return filtered
+        enabled = self.enabled_catalog_ids
+        if not enabled:
+            return []
+        return [catalog for catalog in catalogs if catalog.get('id', '') in enabled]
 
     def get_enabled_catalog_count(self) -> int:
         """Get total number of enabled catalogs"""
@@ -39,12 +39,33 @@ USAGE:
     print(parts['catalog_id'])
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 
 SEPARATOR = '|'
 EXPECTED_PARTS = 3
 
+# Bounded so long-running processes don't grow without limit
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tuple(full_id: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a full catalog ID into its three parts (cached).
+
+    Returns:
+        Tuple of (addon_url, catalog_id, catalog_type), or None if the ID is malformed
+    """
+    # Validate with a C-level count first so malformed IDs allocate nothing
+    if full_id.count(SEPARATOR) != EXPECTED_PARTS - 1:
+        return None
+    # Two bounded partitions instead of a full split - no intermediate list
+    addon_url, _, rest = full_id.partition(SEPARATOR)
+    catalog_id, _, catalog_type = rest.partition(SEPARATOR)
+    return addon_url, catalog_id, catalog_type
+
 
 def create_catalog_id(addon_url: str, catalog_id: str, catalog_type: str) -> str:
     """
@@ -80,9 +101,9 @@ def parse_catalog_id(full_id: str) -> Dict[str, Optional[str]]:
         >>> parse_catalog_id("http://example.com|movies-top|movie")
         {'addon_url': 'http://example.com', 'catalog_id': 'movies-top', 'catalog_type': 'movie'}
     """
-    parts = full_id.split(SEPARATOR)
+    parts = _parse_tuple(full_id)
 
-    if len(parts) != EXPECTED_PARTS:
+    if parts is None:
         return {
             'addon_url': None,
             'catalog_id': None,
@@ -111,8 +132,8 @@ def get_catalog_id_part(full_id: str) -> str:
         >>> get_catalog_id_part("http://example.com|movies-top|movie")
         "movies-top"
     """
-    parts = full_id.split(SEPARATOR)
-    if len(parts) != EXPECTED_PARTS:
+    parts = _parse_tuple(full_id)
+    if parts is None:
         return ''
     return parts[1]
 
@@ -132,8 +153,8 @@ def get_addon_url_part(full_id: str) -> str:
         >>> get_addon_url_part("http://example.com|movies-top|movie")
         "http://example.com"
     """
-    parts = full_id.split(SEPARATOR)
-    if len(parts) != EXPECTED_PARTS:
+    parts = _parse_tuple(full_id)
+    if parts is None:
         return ''
     return parts[0]
 
@@ -153,7 +174,7 @@ def get_catalog_type_part(full_id: str) -> str:
         >>> get_catalog_type_part("http://example.com|movies-top|movie")
         "movie"
     """
-    parts = full_id.split(SEPARATOR)
-    if len(parts) != EXPECTED_PARTS:
+    parts = _parse_tuple(full_id)
+    if parts is None:
         return ''
     return parts[2]
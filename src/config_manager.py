@@ -3,14 +3,69 @@ Configuration Manager
 Handles persistence of user configuration to disk
 """
 
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, Any, List, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
 logger = get_logger('streams_prefetcher.config_manager')
 
+# Delay before coalesced set()/update() changes are written to disk (seconds)
+FLUSH_DELAY = 0.25
+# Delay before retrying a debounced flush whose write failed (seconds)
+FLUSH_RETRY_DELAY = 5.0
+
+# (CLI flag, config key) pairs for integer limits passed through verbatim
+_INT_KEY_FLAGS = (
+    ('--movies-global-limit', 'movies_global_limit'),
+    ('--series-global-limit', 'series_global_limit'),
+    ('--movies-per-catalog', 'movies_per_catalog'),
+    ('--series-per-catalog', 'series_per_catalog'),
+    ('--items-per-mixed-catalog', 'items_per_mixed_catalog'),
+)
+
+# (CLI flag, config key) pairs for durations stored in seconds
+_SECONDS_KEY_FLAGS = (
+    ('--cache-validity', 'cache_validity'),
+    ('--max-execution-time', 'max_execution_time'),
+)
+
+# (CLI flag, config key) pairs for boolean switches
+_BOOL_KEY_FLAGS = (
+    ('--randomize-catalog-processing', 'randomize_catalog_processing'),
+    ('--randomize-item-prefetching', 'randomize_item_prefetching'),
+    ('--enable-logging', 'enable_logging'),
+)
+
+# (CLI flag, config key) pairs for switches passed when the key is False
+_NEGATED_BOOL_KEY_FLAGS = (
+    ('--sqlite-no-wal', 'sqlite_wal'),
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to pretty-printed JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ConfigManager:
     """Manages configuration persistence"""
 
@@ -29,6 +84,7 @@ class ConfigManager:
         'cache_validity': 604800,  # 1 week in seconds
         'max_execution_time': 5400,  # 90 minutes in seconds
         'enable_logging': False,
+        'sqlite_wal': True,  # Disable on NFS/network filesystems without shared-memory support
         'catalog_selection': {},  # {catalog_id: {enabled: bool, order: int}}
         'schedule': {
             'enabled': False,
@@ -47,88 +103,179 @@ class ConfigManager:
 
     def __init__(self, config_path: str = 'data/config/config.json'):
         self.config_path = Path(config_path)
+        self._last_hash: Optional[bytes] = None  # Digest of the last payload written
+        # (st_mtime_ns, st_size) of the file right after that write
+        self._written_stat_key: Optional[Tuple[int, int]] = None
+        self._dirty = False  # In-memory changes not yet written to disk
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
         self.config = self.load()
 
+    def _default_config(self) -> Dict[str, Any]:
+        """Return a fresh deep copy of DEFAULT_CONFIG (nested dicts aren't shared)"""
+        return _loads(_DEFAULT_BYTES)
+
+    @staticmethod
+    def _migrate(config: Dict[str, Any]):
+        """Rename legacy keys in a loaded config in place"""
+        cache_config = config.get('cache_uncached_streams')
+        if isinstance(cache_config, dict) and 'max_required_cached_streams' in cache_config:
+            legacy_value = cache_config.pop('max_required_cached_streams')
+            cache_config.setdefault('cached_streams_count_threshold', legacy_value)
+
     def load(self) -> Dict[str, Any]:
         """Load configuration from disk or return default"""
         try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                config = self.DEFAULT_CONFIG.copy()
-                config.update(loaded_config)
-                return config
-            else:
-                return self.DEFAULT_CONFIG.copy()
+            # EAFP: a missing file surfaces as FileNotFoundError from the
+            # open we need anyway, instead of a separate exists() call
+            with open(self.config_path, 'rb') as f:
+                loaded_config = _loads(f.read())
+            self._migrate(loaded_config)
+            # Merge with defaults to ensure all keys exist
+            config = self._default_config()
+            config.update(loaded_config)
+            return config
+        except FileNotFoundError:
+            return self._default_config()
         except Exception as e:
             print(f"Error loading config: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return self._default_config()
 
-    def save(self, config: Dict[str, Any] = None) -> bool:
-        """Save configuration to disk"""
+    def save(self, config: Dict[str, Any] = None, force: bool = False) -> bool:
+        """Save configuration to disk (skipped if unchanged since last save, unless forced)"""
         try:
-            logger.info(f"[CONFIG SAVE] save() called, config_path={self.config_path}")
+            logger.debug("[CONFIG SAVE] save() called, config_path=%s", self.config_path)
 
             # Ensure directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            logger.info(f"[CONFIG SAVE] Config directory ensured: {self.config_path.parent}")
+            logger.debug("[CONFIG SAVE] Config directory ensured: %s", self.config_path.parent)
 
             # Use provided config or instance config
             config_to_save = config if config is not None else self.config
-            logger.info(f"[CONFIG SAVE] Config keys to save: {list(config_to_save.keys())}")
 
-            # Log saved_catalogs if present
-            if 'saved_catalogs' in config_to_save:
-                saved_cat_count = len(config_to_save['saved_catalogs'])
-                logger.info(f"[CONFIG SAVE] saved_catalogs count: {saved_cat_count}")
-                if saved_cat_count > 0:
-                    enabled_count = len([c for c in config_to_save['saved_catalogs'] if c.get('enabled', False)])
-                    logger.info(f"[CONFIG SAVE] Enabled catalogs in saved_catalogs: {enabled_count}")
+            # Only pay for the key list and O(N) enabled count when debug is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CONFIG SAVE] Config keys to save: %s", list(config_to_save.keys()))
+
+                # Log saved_catalogs if present
+                if 'saved_catalogs' in config_to_save:
+                    saved_cat_count = len(config_to_save['saved_catalogs'])
+                    logger.debug("[CONFIG SAVE] saved_catalogs count: %s", saved_cat_count)
+                    if saved_cat_count > 0:
+                        enabled_count = sum(1 for c in config_to_save['saved_catalogs'] if c.get('enabled', False))
+                        logger.debug("[CONFIG SAVE] Enabled catalogs in saved_catalogs: %s", enabled_count)
 
             # Write to disk with pretty formatting
-            logger.info(f"[CONFIG SAVE] Writing to {self.config_path}...")
-            with open(self.config_path, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+            logger.debug("[CONFIG SAVE] Writing to %s...", self.config_path)
+            payload = _dumps(config_to_save)
+            payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+            if self._last_hash is not None and self._current_stat_key() != self._written_stat_key:
+                # File was edited or removed behind our back - don't trust the digest
+                self._last_hash = None
+            if not force and payload_hash == self._last_hash:
+                logger.debug("[CONFIG SAVE] Config unchanged, skipping write")
+            else:
+                self._write_atomic(payload)
+                self._last_hash = payload_hash
+                self._written_stat_key = self._current_stat_key()
+
+                logger.debug("[CONFIG SAVE] ✓ File written successfully, size: %s bytes", len(payload))
 
-            file_size = os.path.getsize(self.config_path)
-            logger.info(f"[CONFIG SAVE] ✓ File written successfully, size: {file_size} bytes")
+            self._dirty = False
 
             # Update instance config
             if config is not None:
                 self.config = config
-                logger.info("[CONFIG SAVE] Instance config updated")
+                logger.debug("[CONFIG SAVE] Instance config updated")
 
             return True
         except Exception as e:
-            logger.error(f"[CONFIG SAVE] ✗ Error saving config: {e}", exc_info=True)
+            logger.error("[CONFIG SAVE] ✗ Error saving config: %s", e, exc_info=True)
             print(f"Error saving config: {e}")
             return False
 
+    def _current_stat_key(self) -> Optional[Tuple[int, int]]:
+        """Return (st_mtime_ns, st_size) of the config file, or None if it is missing"""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _write_atomic(self, payload: bytes):
+        """Write payload in one call to a temp file, then rename it over the config"""
+        tmp_path = self.config_path.with_suffix('.json.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.config_path)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
         return self.config.get(key, default)
 
+    def _start_flush_timer(self, delay: float):
+        """(Re)start the flush timer; caller must hold _flush_lock"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(delay, self._timer_flush)
+        self._flush_timer.start()
+
+    def _timer_flush(self):
+        """Debounced flush run on the timer thread; retries later if the write fails"""
+        if not self.flush():
+            with self._flush_lock:
+                if self._dirty and self._flush_timer is None:
+                    logger.warning("[CONFIG SAVE] Retrying failed save in %ss", FLUSH_RETRY_DELAY)
+                    self._start_flush_timer(FLUSH_RETRY_DELAY)
+
+    def flush(self) -> bool:
+        """Write pending in-memory changes to disk"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            # save() leaves _dirty set when the write fails
+            return self.save()
+
     def set(self, key: str, value: Any) -> bool:
-        """Set a configuration value and save"""
-        logger.info(f"[CONFIG SET] set() called for key='{key}'")
+        """Set a configuration value (written to disk shortly after by flush())"""
+        logger.debug("[CONFIG SET] set() called for key='%s'", key)
 
         if key == 'saved_catalogs':
-            count = len(value) if isinstance(value, list) else 0
-            logger.info(f"[CONFIG SET] Setting saved_catalogs with {count} catalogs")
+            logger.debug("[CONFIG SET] Setting saved_catalogs with %s catalogs",
+                         len(value) if isinstance(value, list) else 0)
 
-        self.config[key] = value
-        logger.info(f"[CONFIG SET] Key '{key}' updated in memory, calling save()...")
+        # Mutate under the lock so the timer thread never serializes a dict mid-update
+        with self._flush_lock:
+            self.config[key] = value
+            self._dirty = True
+            self._start_flush_timer(FLUSH_DELAY)
 
-        result = self.save()
-        logger.info(f"[CONFIG SET] save() returned: {result}")
+        return True
+
+    def set_immediate(self, key: str, value: Any) -> bool:
+        """Set a configuration value and save it to disk before returning"""
+        with self._flush_lock:
+            self.config[key] = value
+            self._dirty = True
+        result = self.flush()
+        logger.debug("[CONFIG SET] save() returned: %s", result)
 
         return result
 
     def update(self, updates: Dict[str, Any]) -> bool:
-        """Update multiple configuration values and save"""
-        self.config.update(updates)
-        return self.save()
+        """Update multiple configuration values (written to disk shortly after by flush())"""
+        with self._flush_lock:
+            self.config.update(updates)
+            self._dirty = True
+            self._start_flush_timer(FLUSH_DELAY)
+        return True
 
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration"""
@@ -136,44 +283,52 @@ class ConfigManager:
 
     def reset(self) -> bool:
         """Reset configuration to defaults"""
-        self.config = self.DEFAULT_CONFIG.copy()
-        return self.save()
+        with self._flush_lock:
+            self.config = self._default_config()
+            self._dirty = True
+        return self.flush()
 
     def to_cli_args(self) -> List[str]:
         """Convert configuration to CLI arguments for streams_prefetcher.py"""
+        config = self.config
         args = []
+        append = args.append
 
         # Addon URLs (required)
-        if self.config['addon_urls']:
-            url_strings = [f"{item['type']}:{item['url']}" for item in self.config['addon_urls']]
-            args.extend(['--addon-urls', ','.join(url_strings)])
+        if config['addon_urls']:
+            append('--addon-urls')
+            append(','.join(f"{item['type']}:{item['url']}" for item in config['addon_urls']))
 
         # Integer limits
-        args.extend(['--movies-global-limit', str(self.config['movies_global_limit'])])
-        args.extend(['--series-global-limit', str(self.config['series_global_limit'])])
-        args.extend(['--movies-per-catalog', str(self.config['movies_per_catalog'])])
-        args.extend(['--series-per-catalog', str(self.config['series_per_catalog'])])
-        args.extend(['--items-per-mixed-catalog', str(self.config['items_per_mixed_catalog'])])
+        for flag, key in _INT_KEY_FLAGS:
+            append(flag)
+            append(str(config[key]))
 
         # Time-based parameters (convert seconds to string format)
-        if self.config['delay'] > 0:
-            args.extend(['--delay', f"{self.config['delay']}s"])
+        if config['delay'] > 0:
+            append('--delay')
+            append(f"{config['delay']}s")
 
-        args.extend(['--cache-validity', f"{self.config['cache_validity']}s"])
-        args.extend(['--max-execution-time', f"{self.config['max_execution_time']}s"])
+        for flag, key in _SECONDS_KEY_FLAGS:
+            append(flag)
+            append(f"{config[key]}s")
 
         # Proxy (optional)
-        if self.config.get('proxy'):
-            args.extend(['--proxy', self.config['proxy']])
+        if config.get('proxy'):
+            append('--proxy')
+            append(config['proxy'])
 
         # Flags
-        if self.config['randomize_catalog_processing']:
-            args.append('--randomize-catalog-processing')
-
-        if self.config['randomize_item_prefetching']:
-            args.append('--randomize-item-prefetching')
+        for flag, key in _BOOL_KEY_FLAGS:
+            if config[key]:
+                append(flag)
 
-        if self.config['enable_logging']:
-            args.append('--enable-logging')
+        for flag, key in _NEGATED_BOOL_KEY_FLAGS:
+            if not config[key]:
+                append(flag)
 
         return args
+
+
+# Pre-serialized defaults; parsing these is cheaper than copy.deepcopy per reset
+_DEFAULT_BYTES = json.dumps(ConfigManager.DEFAULT_CONFIG).encode('utf-8')
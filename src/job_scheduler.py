@@ -3,17 +3,21 @@ Job Scheduler
 Manages prefetch job execution and scheduling using APScheduler
 """
 
+import functools
+import logging
 import threading
 import time
 import sys
-import io
 import ctypes
 import os
+import queue
+import re
+from enum import IntEnum
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Callable
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.events import EVENT_JOB_SUBMITTED, EVENT_JOB_MISSED, EVENT_JOB_REMOVED
 from apscheduler.triggers.cron import CronTrigger
-from croniter import croniter
 import pytz
 
 from config_manager import ConfigManager
@@ -26,18 +30,176 @@ logger = get_logger('job_scheduler')
 # If a job stays in CANCELLED status longer than this, force reset to IDLE
 CANCELLATION_TIMEOUT = 30
 
+# Seconds to wait for a cooperative cancel before injecting KeyboardInterrupt
+CANCEL_ESCALATION_DELAY = 5
+
+# Output lines are delivered to callbacks in batches: once this many lines
+# are pending, or after this many seconds, whichever comes first
+OUTPUT_BATCH_LINES = 64
+OUTPUT_BATCH_INTERVAL = 0.1
+
+# At most one progress notification per this many seconds; the latest
+# update always wins and a trailing flush delivers the final state
+PROGRESS_NOTIFY_INTERVAL = 0.05
+
+
+# UI day numbers (0=Sun, 1=Mon, ..., 6=Sat) -> cron day_of_week (0=Mon, ..., 6=Sun)
+_UI_TO_CRON_DOW = (6, 0, 1, 2, 3, 4, 5)
+
+# Cheap shape check for 5-field crontab expressions (numbers, names, * - , /)
+_CRONTAB_RE = re.compile(r'^[\w*\-,/]+(?:\s+[\w*\-,/]+){4}$')
+
+
+@functools.lru_cache(maxsize=32)
+def _get_timezone(tz_name: str):
+    """pytz timezone lookup (cached - skips pytz's per-call name normalization)"""
+    return pytz.timezone(tz_name)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_cron_trigger(days_str: str, hour: int, minute: int, tz_name: str) -> CronTrigger:
+    """Build (or reuse) a CronTrigger for the given days and time"""
+    return CronTrigger(
+        day_of_week=days_str,
+        hour=hour,
+        minute=minute,
+        timezone=_get_timezone(tz_name)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_crontab(cron_expression: str, tz_name: str) -> CronTrigger:
+    """Parse a crontab expression into a CronTrigger (valid results are cached)"""
+    return CronTrigger.from_crontab(cron_expression, timezone=_get_timezone(tz_name))
+
+# Maximum number of callback events waiting for the notifier thread. When a
+# slow consumer lets the queue fill up, the oldest events are dropped.
+NOTIFY_QUEUE_SIZE = 4096
+
+
+class JobStatus(IntEnum):
+    """Job status constants (serialized as lowercase names via status_name)"""
+    IDLE = 0
+    SCHEDULED = 1
+    RUNNING = 2
+    PAUSING = 3
+    PAUSED = 4
+    RESUMING = 5
+    COMPLETED = 6
+    FAILED = 7
+    CANCELLED = 8
+
+
+# API/JSON names indexed by status value
+_STATUS_NAMES = tuple(status.name.lower() for status in JobStatus)
+
+# Statuses in which a job thread is active and can be cancelled
+_ACTIVE_STATUSES = frozenset({JobStatus.RUNNING, JobStatus.PAUSING, JobStatus.PAUSED, JobStatus.RESUMING})
+
+
+class StdoutRing:
+    """
+    Bounded single-producer/single-consumer buffer used as a stand-in for sys.stdout.
+
+    The job thread writes into a fixed power-of-two ring of string slots; a
+    drain thread forwards batches of writes to a callback. Only head/tail are
+    shared, and an Event wakes the drain thread instead of a lock per write.
+    """
+
+    # Code that inspects stdout (encoding checks, isatty() for colors) sees a plain pipe
+    encoding = 'utf-8'
+
+    def __init__(self, callback: Callable[[str], None], size: int = 1024):
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Ring size must be a power of two, got {size}")
+        self._callback = callback
+        self._buf = [None] * size
+        self._mask = size - 1
+        self._head = 0  # Next slot to write (producer only)
+        self._tail = 0  # Next slot to read (consumer only)
+        self._closed = False
+        self._data_ready = threading.Event()
+        self._space_ready = threading.Event()
+        self._thread = threading.Thread(target=self._drain, name='stdout-drain', daemon=True)
+        self._thread.start()
+
+    def write(self, text: str) -> int:
+        if not text:
+            return 0
+        # Ring full - let the consumer catch up rather than dropping output
+        while self._head - self._tail > self._mask:
+            self._data_ready.set()
+            self._space_ready.wait(0.05)
+            self._space_ready.clear()
+        self._buf[self._head & self._mask] = text
+        self._head += 1
+        self._data_ready.set()
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
 
-class JobStatus:
-    """Job status constants"""
-    IDLE = "idle"
-    SCHEDULED = "scheduled"
-    RUNNING = "running"
-    PAUSING = "pausing"
-    PAUSED = "paused"
-    RESUMING = "resuming"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+    def _drain(self):
+        while not (self._closed and self._tail == self._head):
+            self._data_ready.wait(0.1)
+            self._data_ready.clear()
+            head = self._head
+            if self._tail == head:
+                continue
+            chunks = []
+            while self._tail != head:
+                idx = self._tail & self._mask
+                chunks.append(self._buf[idx])
+                self._buf[idx] = None
+                self._tail += 1
+            self._space_ready.set()
+            self._callback(''.join(chunks))
+
+    def close(self):
+        """Stop accepting output and wait until everything written has been delivered"""
+        self._closed = True
+        self._data_ready.set()
+        self._thread.join()
+
+
+class ThreadLocalStdout:
+    """
+    sys.stdout proxy that routes writes per thread.
+
+    A thread that has set a target (the job thread) writes into it; every other
+    thread keeps writing to the real stdout, so unrelated output never ends up
+    in the job's buffer.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._tls = threading.local()
+
+    def _target(self):
+        return getattr(self._tls, 'target', None) or self._real
+
+    def set_target(self, target):
+        """Redirect the calling thread's writes (None restores the real stdout)"""
+        self._tls.target = target
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    @classmethod
+    def install(cls) -> 'ThreadLocalStdout':
+        """Wrap sys.stdout once and return the proxy"""
+        if not isinstance(sys.stdout, cls):
+            sys.stdout = cls(sys.stdout)
+        return sys.stdout
 
 
 class JobScheduler:
@@ -49,15 +211,31 @@ class JobScheduler:
         # Get timezone from environment variable, default to UTC
         tz_name = os.environ.get('TZ', 'UTC')
         try:
-            self.timezone = pytz.timezone(tz_name)
-            logger.info(f"Using timezone from TZ environment variable: {tz_name}")
+            self.timezone = _get_timezone(tz_name)
+            logger.info("Using timezone from TZ environment variable: %s", tz_name)
         except pytz.UnknownTimeZoneError:
-            logger.warning(f"Unknown timezone '{tz_name}', falling back to UTC")
+            logger.warning("Unknown timezone '%s', falling back to UTC", tz_name)
+            tz_name = 'UTC'
             self.timezone = pytz.UTC
+        self.timezone_name = tz_name
 
         self.scheduler = BackgroundScheduler(timezone=self.timezone)
         self.scheduler.start()
 
+        # Job output is captured per thread instead of swapping sys.stdout globally
+        self.stdout_proxy = ThreadLocalStdout.install()
+
+        # Schedule state cached for status polls; refreshed whenever the
+        # prefetch jobs change or one of them fires
+        self._cached_next_run = None
+        self._cached_next_run_iso = None  # isoformat() of _cached_next_run
+        self._is_scheduled = False
+        self._prefetch_job_ids = set()  # IDs of prefetch jobs currently in the scheduler
+        self.scheduler.add_listener(
+            self._on_scheduler_event,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED | EVENT_JOB_REMOVED
+        )
+
         # Job state - Always start fresh on initialization
         self.current_job = None
         self.job_thread = None
@@ -65,28 +243,57 @@ class JobScheduler:
         self.job_status = JobStatus.IDLE  # Reset to IDLE on startup
         self.job_start_time = None
         self.job_end_time = None
+        # Monotonic clock readings for durations (wall-clock fields are for display)
+        self._job_start_mono = None
+        self._job_end_mono = None
         self.cancellation_start_time = None  # Track when cancellation began
         self.job_error = None
         self.job_summary = None  # Store completion summary
-        self.pause_requested = False  # Flag to request pause after current item
-        self.is_paused = False  # Actual pause state flag
+        # Pause state lives in job_status (PAUSING = requested, PAUSED = in effect)
         self.pause_event = threading.Event()  # Efficient pause/resume signaling
         self.pause_event.set()  # Start unpaused (set = not paused)
+        self.cancel_event = threading.Event()  # Cooperative stop signal (set = cancel requested)
+        self._start_lock = threading.Lock()  # Serializes the run_job check-and-set
 
         # Log startup state
         logger.info("JobScheduler initialized - job status reset to IDLE")
 
-        # Live output buffer
-        self.output_lines = []
+        # Live output buffer: a fixed ring of line slots. Writers (serialized by
+        # output_lock) reserve slots, fill them and then publish (base, head) -
+        # absolute line numbers of the job's first line and the next line to
+        # write - in one assignment, so get_output can read without the lock.
+        self.max_output_lines = 1024  # Keep last 1024 lines (power of two for masking)
+        self._output_mask = self.max_output_lines - 1
+        self._output_buf = [None] * self.max_output_lines
+        self._output_state = (0, 0)
+        self._output_reserved = 0  # Head once in-flight writes complete
         self.output_lock = threading.Lock()
-        self.max_output_lines = 1000  # Keep last 1000 lines
 
-        # Progress tracking
+        # Lines appended but not yet sent to callbacks (guarded by output_lock)
+        self._pending_lines = []
+        self._pending_deadline = 0.0
+        # Trailing partial line waiting for its newline (guarded by output_lock)
+        self._line_carry = ''
+        self._output_flusher_stop = threading.Event()
+        self._output_flusher = threading.Thread(
+            target=self._output_flush_loop, name='output-flusher', daemon=True
+        )
+        self._output_flusher.start()
+
+        # Progress tracking: an immutable snapshot replaced wholesale on each
+        # update, so readers never need a lock or a copy
         self.progress_data = {}
-        self.progress_lock = threading.Lock()
+        self._progress_dirty = False  # Snapshot changed since last notification
+        self._last_progress_notify = 0.0
 
-        # Callbacks for real-time updates
+        # Callbacks for real-time updates (dispatched from a notifier thread)
         self.status_callbacks = []
+        self._notify_queue = queue.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+        self._dropped_notifications = 0
+        self._notifier = threading.Thread(
+            target=self._notify_loop, name='notifier', daemon=True
+        )
+        self._notifier.start()
 
         # Initialize scheduled job from config
         self._load_scheduled_job()
@@ -96,12 +303,38 @@ class JobScheduler:
         self.status_callbacks.append(callback)
 
     def _notify_callbacks(self, event_type: str, data: Dict[str, Any]):
-        """Notify all registered callbacks"""
+        """Queue an event for the notifier thread (never blocks the caller)"""
+        event = (event_type, data)
+        while True:
+            try:
+                self._notify_queue.put_nowait(event)
+                return
+            except queue.Full:
+                # Drop the oldest event to make room for the newest one
+                try:
+                    self._notify_queue.get_nowait()
+                    self._dropped_notifications += 1
+                except queue.Empty:
+                    pass
+
+    def _notify_loop(self):
+        """Deliver queued events to all registered callbacks"""
+        while True:
+            event = self._notify_queue.get()
+            if event is None:
+                return
+            if self._dropped_notifications:
+                dropped, self._dropped_notifications = self._dropped_notifications, 0
+                logger.warning("Dropped %s queued notifications (callbacks too slow)", dropped)
+            self._dispatch(*event)
+
+    def _dispatch(self, event_type: str, data: Dict[str, Any]):
+        """Call every registered callback with this event"""
         for callback in self.status_callbacks:
             try:
                 callback(event_type, data)
             except Exception as e:
-                print(f"Error in callback: {e}")
+                logger.exception("Error in callback: %s", e)
 
     def _load_scheduled_job(self):
         """Load scheduled job from configuration"""
@@ -120,17 +353,21 @@ class JobScheduler:
     def update_schedule(self, cron_expression: str, timezone_str: str = 'UTC'):
         """Update the scheduled job"""
         try:
-            # Validate cron expression
-            if not croniter.is_valid(cron_expression):
+            # Reject malformed expressions before parsing; building the
+            # trigger does the full validation
+            if not _CRONTAB_RE.match(cron_expression.strip()):
+                raise ValueError(f"Invalid cron expression: {cron_expression}")
+            try:
+                trigger = _parse_crontab(cron_expression, timezone_str)
+            except (ValueError, TypeError):
                 raise ValueError(f"Invalid cron expression: {cron_expression}")
 
             # Remove existing job if any
-            if self.scheduler.get_job('prefetch_job'):
+            if 'prefetch_job' in self._prefetch_job_ids:
                 self.scheduler.remove_job('prefetch_job')
+                self._prefetch_job_ids.discard('prefetch_job')
 
             # Add new job
-            tz = pytz.timezone(timezone_str)
-            trigger = CronTrigger.from_crontab(cron_expression, timezone=tz)
             self.scheduler.add_job(
                 self.run_job,
                 trigger=trigger,
@@ -138,6 +375,7 @@ class JobScheduler:
                 name='Scheduled Prefetch Job',
                 replace_existing=True
             )
+            self._prefetch_job_ids.add('prefetch_job')
 
             # Update config
             self.config_manager.update({
@@ -150,16 +388,17 @@ class JobScheduler:
 
             return True
         except Exception as e:
-            print(f"Error updating schedule: {e}")
+            logger.error("Error updating schedule: %s", e)
             return False
+        finally:
+            # Jobs may already have been removed when a later step fails
+            self._refresh_schedule_cache()
 
     def update_schedules(self, enabled: bool, schedules: list):
         """Update multiple scheduled jobs from UI format"""
         try:
             # Remove all existing scheduled jobs
-            for job in self.scheduler.get_jobs():
-                if job.id.startswith('prefetch_job'):
-                    self.scheduler.remove_job(job.id)
+            self._remove_prefetch_jobs()
 
             if enabled and schedules:
                 # Add new jobs for each schedule
@@ -170,36 +409,28 @@ class JobScheduler:
                     # Parse time
                     hour, minute = map(int, time_str.split(':'))
 
-                    # Convert day numbers to cron day_of_week format
-                    # UI uses: 0=Sun, 1=Mon, ..., 6=Sat
-                    # Cron uses: 0=Mon, 1=Tue, ..., 6=Sun
-                    # So we need to convert
-                    cron_days = []
+                    # Reject out-of-range days (negative ones would index from the end)
                     for day in days:
-                        if day == 0:  # Sunday
-                            cron_days.append(6)
-                        else:  # Mon-Sat
-                            cron_days.append(day - 1)
+                        if not 0 <= day < 7:
+                            raise ValueError(f"Schedule #{idx + 1} has invalid day value {day!r}. Must be 0-6")
 
-                    cron_days.sort()
+                    # Convert UI day numbers to cron day_of_week format (deduplicated)
+                    cron_days = sorted({_UI_TO_CRON_DOW[day] for day in days})
                     days_str = ','.join(map(str, cron_days))
 
-                    # Create cron trigger
-                    trigger = CronTrigger(
-                        day_of_week=days_str,
-                        hour=hour,
-                        minute=minute,
-                        timezone=self.timezone
-                    )
+                    # Create cron trigger (identical schedules reuse the same trigger)
+                    trigger = _build_cron_trigger(days_str, hour, minute, self.timezone_name)
 
                     # Add job
+                    job_id = f'prefetch_job_{idx}'
                     self.scheduler.add_job(
                         self.run_job,
                         trigger=trigger,
-                        id=f'prefetch_job_{idx}',
+                        id=job_id,
                         name=f'Scheduled Prefetch Job #{idx + 1}',
                         replace_existing=True
                     )
+                    self._prefetch_job_ids.add(job_id)
 
             # Update config
             self.config_manager.update({
@@ -211,15 +442,17 @@ class JobScheduler:
 
             return True
         except Exception as e:
-            print(f"Error updating schedules: {e}")
+            logger.error("Error updating schedules: %s", e)
             return False
+        finally:
+            # Jobs may already have been removed when a later step fails
+            self._refresh_schedule_cache()
 
     def disable_schedule(self):
         """Disable scheduled job"""
         # Remove all scheduled jobs
-        for job in self.scheduler.get_jobs():
-            if job.id.startswith('prefetch_job'):
-                self.scheduler.remove_job(job.id)
+        self._remove_prefetch_jobs()
+        self._refresh_schedule_cache()
 
         self.config_manager.update({
             'schedule': {
@@ -228,47 +461,80 @@ class JobScheduler:
             }
         })
 
-    def get_next_run_time(self) -> Optional[datetime]:
-        """Get next scheduled run time (earliest among all scheduled jobs)"""
+    def _remove_prefetch_jobs(self):
+        """Remove every prefetch job we have added to the scheduler"""
+        for job_id in list(self._prefetch_job_ids):
+            if self.scheduler.get_job(job_id):
+                self.scheduler.remove_job(job_id)
+        self._prefetch_job_ids.clear()
+
+    def _refresh_schedule_cache(self):
+        """Recompute cached next run time and scheduled flag from our prefetch jobs"""
         next_times = []
-        for job in self.scheduler.get_jobs():
-            if job.id.startswith('prefetch_job') and job.next_run_time:
+        for job_id in list(self._prefetch_job_ids):
+            job = self.scheduler.get_job(job_id)
+            if job and job.next_run_time:
                 next_times.append(job.next_run_time)
 
-        return min(next_times) if next_times else None
+        next_run = min(next_times) if next_times else None
+        self._cached_next_run_iso = next_run.isoformat() if next_run else None
+        self._cached_next_run = next_run
+        self._is_scheduled = bool(self._prefetch_job_ids)
+
+    def _on_scheduler_event(self, event):
+        """Keep the schedule cache current after a prefetch job fires or is removed"""
+        if event.job_id in self._prefetch_job_ids:
+            if event.code == EVENT_JOB_REMOVED:
+                self._prefetch_job_ids.discard(event.job_id)
+            self._refresh_schedule_cache()
+
+    def get_next_run_time(self) -> Optional[datetime]:
+        """Get next scheduled run time (earliest among all scheduled jobs)"""
+        next_run = self._cached_next_run
+        # Only go back to the jobstore once the cached time has passed
+        if next_run is not None and next_run <= datetime.now(timezone.utc):
+            self._refresh_schedule_cache()
+            next_run = self._cached_next_run
+        return next_run
 
     def run_job(self, manual: bool = False):
         """Run a prefetch job"""
-        # Check if job is actually running (not just status stuck)
-        if self.job_status == JobStatus.RUNNING:
-            # If thread is dead but status is stuck, reset it
-            if not self.job_thread or not self.job_thread.is_alive():
-                logger.warning("Job status was RUNNING but thread is dead - resetting status")
-                self.job_status = JobStatus.IDLE
-                self.cancellation_start_time = None
-            else:
-                return False, "Job is already running"
-
-        # Also reset if status is CANCELLED but thread is dead or timed out
-        if self.job_status == JobStatus.CANCELLED:
-            if not self.job_thread or not self.job_thread.is_alive():
-                logger.warning("Job status was CANCELLED but thread is dead - resetting status")
-                self.job_status = JobStatus.IDLE
-                self.cancellation_start_time = None
-            elif self.cancellation_start_time and (time.time() - self.cancellation_start_time) > CANCELLATION_TIMEOUT:
-                # Force reset if cancellation has been stuck too long
-                logger.warning(f"Job cancellation stuck for >{CANCELLATION_TIMEOUT}s - force resetting to IDLE")
-                self.job_status = JobStatus.IDLE
-                self.cancellation_start_time = None
-            else:
-                return False, "Job is being cancelled"
-
-        # Clear previous state
-        with self.output_lock:
-            self.output_lines = []
+        # Check-and-set and thread start under one lock so concurrent starts
+        # can't both pass (or see RUNNING before job_thread is live)
+        with self._start_lock:
+            # Check if job is actually running (not just status stuck)
+            if self.job_status == JobStatus.RUNNING:
+                # If thread is dead but status is stuck, reset it
+                if not self.job_thread or not self.job_thread.is_alive():
+                    logger.warning("Job status was RUNNING but thread is dead - resetting status")
+                    self.job_status = JobStatus.IDLE
+                    self.cancellation_start_time = None
+                else:
+                    return False, "Job is already running"
+
+            # Also reset if status is CANCELLED but thread is dead or timed out
+            if self.job_status == JobStatus.CANCELLED:
+                if not self.job_thread or not self.job_thread.is_alive():
+                    logger.warning("Job status was CANCELLED but thread is dead - resetting status")
+                    self.job_status = JobStatus.IDLE
+                    self.cancellation_start_time = None
+                elif self.cancellation_start_time and (time.time() - self.cancellation_start_time) > CANCELLATION_TIMEOUT:
+                    # Force reset if cancellation has been stuck too long
+                    logger.warning("Job cancellation stuck for >%ss - force resetting to IDLE", CANCELLATION_TIMEOUT)
+                    self.job_status = JobStatus.IDLE
+                    self.cancellation_start_time = None
+                else:
+                    return False, "Job is being cancelled"
+
+            # Clear previous state
+            with self.output_lock:
+                head = self._output_state[1]
+                self._output_state = (head, head)
+                self._pending_lines = []
+                self._line_carry = ''
 
-        with self.progress_lock:
             # Initialize progress with known config values so frontend has data immediately
+            # (the same snapshot is handed to the wrapper so config is read once per job)
             config = self.config_manager.get_all()
             self.progress_data = {
                 'movies_prefetched': 0,
@@ -286,38 +552,38 @@ class JobScheduler:
                 'current_catalog_limit': -1
             }
 
-        self.job_status = JobStatus.RUNNING
-        self.job_start_time = time.time()
-        self.job_end_time = None
-        self.job_error = None
-        self.job_summary = None
-        self.pause_requested = False  # Reset pause request
-        self.is_paused = False  # Reset pause state
-        self.pause_event.set()  # Ensure not paused (set = not paused)
-
-        logger.info("=" * 60)
-        logger.info("PREFETCH JOB STARTING")
-        logger.info("=" * 60)
-        logger.info(f"Job type: {'Manual' if manual else 'Scheduled'}")
-        logger.info(f"Start time: {datetime.fromtimestamp(self.job_start_time).strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # Notify status change
-        self._notify_callbacks('status_change', {
-            'status': self.job_status,
-            'start_time': self.job_start_time
-        })
+            self.job_status = JobStatus.RUNNING
+            self.job_start_time = time.time()
+            self._job_start_mono = time.monotonic()
+            self.job_end_time = None
+            self._job_end_mono = None
+            self.job_error = None
+            self.job_summary = None
+            self.pause_event.set()  # Ensure not paused (set = not paused)
+            self.cancel_event.clear()
+
+            logger.info("=" * 60)
+            logger.info("PREFETCH JOB STARTING")
+            logger.info("=" * 60)
+            logger.info("Job type: %s", 'Manual' if manual else 'Scheduled')
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Start time: %s", time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.job_start_time)))
+
+            # Notify status change
+            self._notify_callbacks('status_change', {
+                'status': self.status_name,
+                'start_time': self.job_start_time
+            })
 
-        # Start job in background thread
-        self.job_thread = threading.Thread(target=self._execute_job, args=(manual,))
-        self.job_thread.daemon = True
-        self.job_thread.start()
+            # Start job in background thread
+            self.job_thread = threading.Thread(target=self._execute_job, args=(manual, config), daemon=True)
+            self.job_thread.start()
 
         return True, "Job started successfully"
 
-    def _execute_job(self, manual: bool):
+    def _execute_job(self, manual: bool, config: Optional[Dict[str, Any]] = None):
         """Execute the prefetch job (runs in background thread)"""
-        old_stdout = sys.stdout
-        output_capture = None
+        output_ring = None
 
         try:
             logger.info("Creating prefetch wrapper")
@@ -327,24 +593,23 @@ class JobScheduler:
                 self.config_manager,
                 scheduler=self,
                 progress_callback=self._update_progress,
-                output_callback=self._append_output
+                output_callback=self._append_output,
+                config=config
             )
 
             logger.info("Starting stdout capture")
 
-            # Now capture stdout for the actual run
-            output_capture = io.StringIO()
-            sys.stdout = output_capture
+            # Now capture stdout for the actual run, streaming it to the output buffer
+            output_ring = StdoutRing(self._append_output)
+            self.stdout_proxy.set_target(output_ring)
 
             result = self.wrapper.run()
 
-            # Restore stdout
-            sys.stdout = old_stdout
-
-            # Get captured output
-            captured = output_capture.getvalue()
-            if captured:
-                self._append_output(captured)
+            # Restore stdout and deliver anything still in the ring
+            self.stdout_proxy.set_target(None)
+            output_ring.close()
+            self._flush_output()
+            self._flush_progress(force=True)
 
             # Extract success and summary
             success = result.get('success', False) if isinstance(result, dict) else result
@@ -358,27 +623,28 @@ class JobScheduler:
                 self.job_status = JobStatus.COMPLETED if success else JobStatus.FAILED
 
             self.job_end_time = time.time()
+            self._job_end_mono = time.monotonic()
             self.cancellation_start_time = None  # Clear cancellation timer
-            duration = self.job_end_time - self.job_start_time
+            duration = self._job_end_mono - self._job_start_mono
 
             logger.info("=" * 60)
             status_str = 'CANCELLED' if interrupted else ('COMPLETED' if success else 'FAILED')
-            logger.info(f"PREFETCH JOB {status_str}")
+            logger.info("PREFETCH JOB %s", status_str)
             logger.info("=" * 60)
-            logger.info(f"Duration: {int(duration // 60)}m {int(duration % 60)}s")
+            logger.info("Duration: %dm %ds", duration // 60, duration % 60)
 
-            if self.job_summary:
+            if self.job_summary and logger.isEnabledFor(logging.INFO):
                 stats = self.job_summary.get('statistics', {})
-                logger.info(f"Movies prefetched: {stats.get('movies_prefetched', 0)}")
-                logger.info(f"Series prefetched: {stats.get('series_prefetched', 0)}")
-                logger.info(f"Items from cache: {stats.get('cached_count', 0)}")
-                logger.info(f"Success rate: {(stats.get('cache_requests_successful', 0) / max(stats.get('cache_requests_made', 1), 1) * 100):.1f}%")
+                logger.info("Movies prefetched: %s", stats.get('movies_prefetched', 0))
+                logger.info("Series prefetched: %s", stats.get('series_prefetched', 0))
+                logger.info("Items from cache: %s", stats.get('cached_count', 0))
+                logger.info("Success rate: %.1f%%", stats.get('cache_requests_successful', 0) / max(stats.get('cache_requests_made', 1), 1) * 100)
 
             logger.info("=" * 60)
 
             # Notify completion
             self._notify_callbacks('job_complete', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'start_time': self.job_start_time,
                 'end_time': self.job_end_time,
                 'duration': duration,
@@ -388,137 +654,249 @@ class JobScheduler:
 
         except Exception as e:
             # CRITICAL: Restore stdout FIRST before any logging
-            sys.stdout = old_stdout
+            self.stdout_proxy.set_target(None)
+            if output_ring is not None:
+                output_ring.close()
+            self._flush_output()
+            self._flush_progress(force=True)
 
             self.job_status = JobStatus.FAILED
             self.job_end_time = time.time()
+            self._job_end_mono = time.monotonic()
             self.job_error = str(e)
 
             logger.error("=" * 60)
             logger.error("PREFETCH JOB FAILED")
             logger.error("=" * 60)
-            logger.error(f"Error: {self.job_error}")
+            logger.error("Error: %s", self.job_error)
             logger.exception(e)
             logger.error("=" * 60)
 
             self._notify_callbacks('job_error', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'error': self.job_error,
                 'start_time': self.job_start_time,
                 'end_time': self.job_end_time
             })
 
     def _append_output(self, text: str):
-        """Append output text to buffer"""
+        """Append output text to buffer (only complete lines are stored)"""
+        with self.output_lock:
+            carry = self._line_carry
+            if '\n' not in text:
+                # Partial line - just extend the carry
+                self._line_carry = carry + text
+                return
+            if not carry and text[-1] == '\n' and text.count('\n') == 1:
+                # Common case: exactly one complete line
+                lines = [text[:-1]]
+            else:
+                lines = (carry + text).split('\n')
+                self._line_carry = lines.pop()
+            self._store_lines(lines)
+
+            # Batch notifications - only deliver once enough lines or time has built up
+            now = time.monotonic()
+            if not self._pending_lines:
+                self._pending_deadline = now + OUTPUT_BATCH_INTERVAL
+            self._pending_lines.extend(lines)
+            if len(self._pending_lines) < OUTPUT_BATCH_LINES and now < self._pending_deadline:
+                return
+            batch, self._pending_lines = self._pending_lines, []
+
+        # Notify callbacks outside the lock
+        self._notify_callbacks('output', {'lines': batch})
+
+    def _store_lines(self, lines):
+        """Write lines into the ring and publish the new head (caller holds output_lock)"""
+        cap = self.max_output_lines
+        mask = self._output_mask
+        buf = self._output_buf
+        base, head = self._output_state
+        lines = lines[-cap:]
+        self._output_reserved = head + len(lines)
+        for line in lines:
+            buf[head & mask] = line
+            head += 1
+        self._output_state = (base, head)
+
+    def _flush_output(self):
+        """Store any trailing partial line and deliver everything pending"""
+        with self.output_lock:
+            if self._line_carry:
+                self._store_lines([self._line_carry])
+                self._pending_lines.append(self._line_carry)
+                self._line_carry = ''
+        self._flush_output_batch()
+
+    def _flush_output_batch(self):
+        """Deliver any pending output lines to callbacks"""
         with self.output_lock:
-            lines = text.split('\n')
-            self.output_lines.extend(lines)
+            if not self._pending_lines:
+                return
+            batch, self._pending_lines = self._pending_lines, []
 
-            # Keep only last N lines
-            if len(self.output_lines) > self.max_output_lines:
-                self.output_lines = self.output_lines[-self.max_output_lines:]
+        self._notify_callbacks('output', {'lines': batch})
 
-        # Notify callbacks
-        self._notify_callbacks('output', {'lines': lines})
+    def _output_flush_loop(self):
+        """Periodically flush pending output and progress so quiet periods don't strand updates"""
+        while not self._output_flusher_stop.wait(PROGRESS_NOTIFY_INTERVAL):
+            if self._pending_lines and time.monotonic() >= self._pending_deadline:
+                self._flush_output_batch()
+            self._flush_progress()
 
     def _update_progress(self, progress: Dict[str, Any]):
         """Update progress data"""
-        with self.progress_lock:
-            self.progress_data.update(progress)
-
-        # Notify callbacks
-        self._notify_callbacks('progress', progress)
+        self.progress_data = {**self.progress_data, **progress}
+        self._progress_dirty = True
+
+        # Notify callbacks (rate limited - the flusher delivers the trailing update)
+        self._flush_progress()
+
+    def _flush_progress(self, force: bool = False):
+        """Send the latest progress snapshot if it changed and the interval has passed"""
+        if not self._progress_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress_notify < PROGRESS_NOTIFY_INTERVAL:
+            return
+        self._progress_dirty = False
+        self._last_progress_notify = now
+        self._notify_callbacks('progress', self.progress_data)
 
     def get_output(self, from_line: int = 0) -> Dict[str, Any]:
         """Get output lines from specified line number"""
-        with self.output_lock:
-            total_lines = len(self.output_lines)
-            lines = self.output_lines[from_line:] if from_line < total_lines else []
-            return {
-                'lines': lines,
-                'total_lines': total_lines,
-                'from_line': from_line
-            }
+        # Read without the lock; only if a writer keeps lapping the read
+        # window do we fall back to reading under it
+        for _ in range(3):
+            snapshot = self._read_output(from_line)
+            if snapshot is not None:
+                break
+        else:
+            with self.output_lock:
+                snapshot = self._read_output(from_line)
+
+        lines, total_lines = snapshot
+        return {
+            'lines': lines,
+            'total_lines': total_lines,
+            'from_line': from_line
+        }
+
+    def _read_output(self, from_line: int):
+        """Copy the requested window, or return None if writers overwrote it meanwhile"""
+        cap = self.max_output_lines
+        buf = self._output_buf
+        base, head = self._output_state
+        total_lines = min(head - base, cap)
+        # Negative offsets count from the end, like a list slice
+        start = max(total_lines + from_line, 0) if from_line < 0 else from_line
+        if start >= total_lines:
+            return [], total_lines
+
+        first = head - total_lines + start
+        mask = self._output_mask
+        lo, hi = first & mask, head & mask
+        lines = buf[lo:hi] if lo < hi else buf[lo:] + buf[:hi]
+
+        # Slots below reserved - cap may have been reused since the snapshot
+        if self._output_reserved - cap > first:
+            return None
+        return lines, total_lines
+
+    @property
+    def status_name(self) -> str:
+        """Current job status as its API/JSON string (e.g. 'running')"""
+        return _STATUS_NAMES[self.job_status]
 
     def get_progress(self) -> Dict[str, Any]:
-        """Get current progress data"""
-        with self.progress_lock:
-            return self.progress_data.copy()
+        """Get current progress data (read-only snapshot)"""
+        return self.progress_data
 
     def get_status(self) -> Dict[str, Any]:
         """Get current job status"""
-        next_run = self.get_next_run_time()
-
-        # Check if any scheduled jobs exist
-        scheduled_jobs = [job for job in self.scheduler.get_jobs() if job.id.startswith('prefetch_job')]
+        self.get_next_run_time()  # Refreshes the cache if the cached time has passed
 
         status_data = {
-            'status': self.job_status,
+            'status': self.status_name,
             'start_time': self.job_start_time,
             'end_time': self.job_end_time,
             'error': self.job_error,
-            'next_run_time': next_run.isoformat() if next_run else None,
+            'next_run_time': self._cached_next_run_iso,
             'progress': self.get_progress(),
-            'is_scheduled': len(scheduled_jobs) > 0
+            'is_scheduled': self._is_scheduled
         }
 
         # Include summary data for completed or cancelled jobs (cancelled jobs have partial results)
-        if (self.job_status == JobStatus.COMPLETED or self.job_status == JobStatus.CANCELLED) and self.job_summary:
+        if self.job_status in (JobStatus.COMPLETED, JobStatus.CANCELLED) and self.job_summary:
             status_data['summary'] = self.job_summary
 
         return status_data
 
     def cancel_job(self):
-        """Cancel running, pausing, or paused job by injecting KeyboardInterrupt into the thread"""
-        if (self.job_status in [JobStatus.RUNNING, JobStatus.PAUSING, JobStatus.PAUSED, JobStatus.RESUMING]) and self.job_thread and self.job_thread.is_alive():
-            # Inject KeyboardInterrupt into the running thread
-            # This allows the wrapper to catch it and return partial results
-            try:
-                thread_id = self.job_thread.ident
-                exc = ctypes.py_object(KeyboardInterrupt)
-                res = ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                    ctypes.c_long(thread_id), exc
-                )
-
-                if res == 0:
-                    # Invalid thread ID
-                    logger.warning("Failed to cancel job: invalid thread ID")
-                    return False
-                elif res > 1:
-                    # More than one thread affected, undo
-                    ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                        ctypes.c_long(thread_id), None
-                    )
-                    logger.warning("Failed to cancel job: multiple threads affected")
-                    return False
+        """Cancel running, pausing, or paused job (cooperative stop, escalating to KeyboardInterrupt injection)"""
+        if self.job_status in _ACTIVE_STATUSES and self.job_thread and self.job_thread.is_alive():
+            # Ask the prefetcher to stop at its next checkpoint (waking it if paused);
+            # it raises KeyboardInterrupt so the wrapper returns partial results
+            self.cancel_event.set()
+            self.pause_event.set()
+
+            # Mark as cancelled (will be confirmed when thread finishes)
+            self.job_status = JobStatus.CANCELLED
+            self.cancellation_start_time = time.time()
+
+            # Don't set end_time yet - wait for thread to finish
+            # The thread will capture results and call job_complete
+
+            # Fall back to interrupting the thread if it doesn't reach a checkpoint in time
+            escalation = threading.Timer(CANCEL_ESCALATION_DELAY, self._interrupt_job_thread, args=(self.job_thread,))
+            escalation.daemon = True
+            escalation.start()
+
+            logger.info("Cancellation requested - job will stop at its next checkpoint")
+            return True
+        return False
 
-                # Mark as cancelled (will be confirmed when thread finishes)
-                self.job_status = JobStatus.CANCELLED
-                self.cancellation_start_time = time.time()
+    def _interrupt_job_thread(self, job_thread: threading.Thread):
+        """Inject KeyboardInterrupt into a job thread that has not honoured cancel_event"""
+        # Nothing to do if the job already stopped or picked up the cancel request
+        if not self.cancel_event.is_set() or job_thread is not self.job_thread or not job_thread.is_alive():
+            return
 
-                # Don't set end_time yet - wait for thread to finish
-                # The thread will capture results and call job_complete
+        try:
+            thread_id = job_thread.ident
+            exc = ctypes.py_object(KeyboardInterrupt)
+            res = ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_long(thread_id), exc
+            )
 
+            if res == 0:
+                # Invalid thread ID
+                logger.warning("Failed to cancel job: invalid thread ID")
+            elif res > 1:
+                # More than one thread affected, undo
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_long(thread_id), None
+                )
+                logger.warning("Failed to cancel job: multiple threads affected")
+            else:
+                self.cancel_event.clear()
                 logger.info("Cancellation signal sent to job thread")
-                return True
 
-            except Exception as e:
-                logger.error(f"Error cancelling job: {e}")
-                return False
-        return False
+        except Exception as e:
+            logger.error("Error cancelling job: %s", e)
 
     def pause_job(self):
         """Request pause for running job - will pause after current item finishes"""
         if self.job_status == JobStatus.RUNNING:
             # Signal pause requested - will pause after current item
-            self.pause_requested = True
             self.job_status = JobStatus.PAUSING
 
             logger.info("Pause requested - will pause after current item finishes")
 
             # Notify callbacks with PAUSING status and current progress
             self._notify_callbacks('status_change', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'start_time': self.job_start_time,
                 'progress': self.get_progress()
             })
@@ -529,8 +907,6 @@ class JobScheduler:
     def complete_pause(self):
         """Complete the pause transition (called by prefetcher after current item finishes)"""
         if self.job_status == JobStatus.PAUSING:
-            self.is_paused = True
-            self.pause_requested = False
             self.pause_event.clear()  # Actually pause (clear = paused)
             self.job_status = JobStatus.PAUSED
 
@@ -538,13 +914,26 @@ class JobScheduler:
 
             # Notify callbacks with PAUSED status and current progress
             self._notify_callbacks('status_change', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'start_time': self.job_start_time,
                 'progress': self.get_progress()
             })
 
             return True
 
+    def wait_if_paused(self):
+        """Block while paused; raise KeyboardInterrupt if the job has been cancelled"""
+        self.pause_event.wait()  # Returns immediately when not paused
+        if self.cancel_event.is_set():
+            self.cancel_event.clear()  # Handled here - no need to escalate
+            raise KeyboardInterrupt
+
+    def check_pause(self):
+        """Complete a requested pause and block until resumed (called by prefetcher between items)"""
+        if self.job_status == JobStatus.PAUSING:
+            self.complete_pause()
+        self.wait_if_paused()
+
     def resume_job(self):
         """Resume paused job"""
         if self.job_status == JobStatus.PAUSED:
@@ -555,13 +944,12 @@ class JobScheduler:
 
             # Notify callbacks with RESUMING status and current progress
             self._notify_callbacks('status_change', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'start_time': self.job_start_time,
                 'progress': self.get_progress()
             })
 
             # Actually resume
-            self.is_paused = False
             self.pause_event.set()  # Signal to resume (set = not paused)
             self.job_status = JobStatus.RUNNING
 
@@ -569,7 +957,7 @@ class JobScheduler:
 
             # Notify callbacks with RUNNING status and current progress
             self._notify_callbacks('status_change', {
-                'status': self.job_status,
+                'status': self.status_name,
                 'start_time': self.job_start_time,
                 'progress': self.get_progress()
             })
@@ -580,3 +968,19 @@ class JobScheduler:
     def shutdown(self):
         """Shutdown scheduler"""
         self.scheduler.shutdown(wait=False)
+        self._output_flusher_stop.set()
+        self._flush_output_batch()
+        self._stop_notifier()
+
+    def _stop_notifier(self):
+        """Stop the notifier thread once already queued events are delivered"""
+        while True:
+            try:
+                self._notify_queue.put_nowait(None)
+                break
+            except queue.Full:
+                try:
+                    self._notify_queue.get_nowait()
+                except queue.Empty:
+                    pass
+        self._notifier.join(timeout=5)
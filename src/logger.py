@@ -21,11 +21,35 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names are built once rather than per record
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            name: f"{color}{name:8}{reset}"
+            for name, color in self.COLORS.items() if name != 'RESET'
+        }
+        self._time_cache = (None, '')  # (whole second, formatted asctime)
+
+    def formatTime(self, record, datefmt=None):
+        # With a whole-second datefmt, asctime only changes once per second
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, text)
+        return text
+
     def format(self, record):
-        # Add color to level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname:8}{self.COLORS['RESET']}"
-        return super().format(record)
+        # Add color to level name, restoring it so other handlers see the original
+        levelname = record.levelname
+        record.levelname = self._colored_levels.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging():
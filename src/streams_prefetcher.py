@@ -7,26 +7,125 @@ and performs stream prefetching for movies and series to preload the addon's cac
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import argparse
 import sys
 import shutil
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import math
 import random
 import sqlite3
 import os
 import re
 from datetime import datetime, timezone
-from urllib.parse import urljoin, quote
+from urllib.parse import urljoin, quote, urlsplit
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
+# Number of queued cache rows that triggers a batched SQLite write
+CACHE_FLUSH_BATCH_SIZE = 50
+
+# IDs per IN (...) query when preloading cache timestamps (below SQLite's bound-parameter limit)
+CACHE_LOOKUP_CHUNK_SIZE = 500
+
+# Hot cache statements; reusing the same strings lets sqlite3's statement cache skip re-preparing them
+_SQL_CACHE_SELECT = "SELECT timestamp FROM cache WHERE imdb_id = ?"
+_SQL_CACHE_UPSERT = "INSERT OR REPLACE INTO cache (imdb_id, timestamp, title_name) VALUES (?, ?, ?)"
+
+# Maximum cache-trigger HEAD requests in flight for one item
+CACHE_REQUEST_WORKERS = 4
+
+# Keep-alive connection pool sizing for the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+# Time strings accepted by parse_time_string, e.g. 500ms, 30s, 5m, 1M
+_TIME_RE = re.compile(r'^(-?\d+(?:\.\d+)?)\s*(ms|MS|[smhdwyM]?)$', re.IGNORECASE)
+# Seconds per unit; 'm' is minutes and 'M' is months
+_TIME_MULTIPLIERS = {
+    'ms': 0.001,
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+    'w': 604800,
+    'M': 2592000,  # 30 days
+    'y': 31536000  # 365 days
+}
+
+# Maximum seconds buffered log lines may wait before being flushed to the log file
+LOG_FLUSH_INTERVAL = 5.0
+
+# Weight of the newest interval in the dashboard's seconds-per-item moving average
+ETA_EMA_ALPHA = 0.2
+
+# Carriage return + erase line, prefixed to every repainted dashboard line
+_CLEAR_LINE = "\r\033[K"
+
+def _remaining(limit: int, current: int) -> float:
+    """Items left under a limit, with -1 (unlimited) mapped to math.inf."""
+    return math.inf if limit == -1 else max(0, limit - current)
+
+# Cached terminal width; reset to None by SIGWINCH so the next call re-measures
+_terminal_width = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _compile_stream_matcher(pattern: str):
+    """Return a callable (name, description) -> bool testing a stream against a regex.
+
+    Patterns without regex metacharacters or whitespace (like the default '⚡') can't span the
+    name/description boundary, so they are checked as plain substrings of each field without
+    building the combined "name description" string.
+    """
+    if re.escape(pattern) == pattern:
+        return lambda name, description: pattern in (name or '') or pattern in (description or '')
+    search = re.compile(pattern).search
+    return lambda name, description: search(f"{name} {description}") is not None
+
 def get_terminal_size() -> int:
     """Safely get terminal width with a fallback."""
+    global _terminal_width
+    if _terminal_width is None:
+        try:
+            _terminal_width = shutil.get_terminal_size().columns
+        except (OSError, ValueError):
+            return 80 # Fallback in case terminal size can't be determined
+    return _terminal_width
+
+def _install_resize_handler():
+    """Invalidate the cached terminal width on SIGWINCH when running in a terminal."""
+    # Signal handlers can only be set from the main thread, and a server process
+    # (e.g. gunicorn) may use SIGWINCH itself, so only hook it for interactive runs
+    if (not hasattr(signal, 'SIGWINCH') or threading.current_thread() is not threading.main_thread()
+            or not sys.stdout.isatty()):
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+
+    def on_resize(signum, frame):
+        global _terminal_width
+        _terminal_width = None
+        if callable(previous):
+            previous(signum, frame)
+
     try:
-        return shutil.get_terminal_size().columns
+        signal.signal(signal.SIGWINCH, on_resize)
     except (OSError, ValueError):
-        return 80 # Fallback in case terminal size can't be determined
+        pass
+
+_install_resize_handler()
 
 class ProgressTracker:
     """Progress tracker with working Termux UI based on reference"""
@@ -41,10 +140,37 @@ class ProgressTracker:
             'RESET': '\033[0m'
         }
         
+        # Pre-rendered progress bar cells keyed by item/catalog status
+        green_cell = f"{self.COLORS['GREEN']}█{self.COLORS['RESET']}"
+        red_cell = f"{self.COLORS['RED']}█{self.COLORS['RESET']}"
+        self._bar_cells = {
+            'success': green_cell,
+            'successful': green_cell,
+            'partial': f"{self.COLORS['YELLOW']}█{self.COLORS['RESET']}",
+            'failed': red_cell,
+        }
+        
         self.overall_catalogs = []
         self.current_catalog_index = 0
         self.dynamic_lines = 22  # Adjusted for all dashboard content including timing
         self.initial_lines_printed = 0  # Track lines printed before dashboard
+        self._last_dashboard_redraw = 0.0
+        self._last_dashboard_mode = None
+        self._pending_dashboard_kwargs = None  # Latest redraw skipped by the throttle
+        self._min_redraw_interval = 0.1  # 100ms = max 10 redraws/second
+        self._cached_start_ts = None
+        self._start_time_str_cache = None
+        # Limits table borders/header/row template, keyed by (catalog label, value column width)
+        self._limits_table_layouts = {}
+        self._last_limits_key = None
+        self._last_limits_lines = []
+        self._last_timing_key = None
+        self._last_timing_lines = []
+        # Recent pace used for the item-based ETA (see _update_item_rate)
+        self._rate_start_ts = None
+        self._last_item_count = 0
+        self._last_item_ts = None
+        self._seconds_per_item_ema = None
         
     def init_overall_progress(self, catalog_names: List[str]):
         """Initialize overall progress tracking"""
@@ -59,44 +185,30 @@ class ProgressTracker:
         for _ in range(self.dynamic_lines):
             print()
         
-    def get_overall_bar(self, statuses: List[str], total: int) -> str:
+    def get_overall_bar(self, statuses: List[str], total: int, term_width: Optional[int] = None) -> str:
         """Generate colored overall progress bar"""
-        term_width = get_terminal_size()
+        if term_width is None:
+            term_width = get_terminal_size()
         bar_width = min(50, term_width - 30)
         if not statuses or total == 0: return " " * bar_width
-        bar = ""
-        for i in range(bar_width):
-            idx = int((i / bar_width) * len(statuses)) if statuses else -1
-            if idx != -1 and idx < len(statuses):
-                if statuses[idx] == 'success': bar += f"{self.COLORS['GREEN']}█{self.COLORS['RESET']}"
-                elif statuses[idx] == 'partial': bar += f"{self.COLORS['YELLOW']}█{self.COLORS['RESET']}"
-                elif statuses[idx] == 'failed': bar += f"{self.COLORS['RED']}█{self.COLORS['RESET']}"
-                else: bar += " "
-            else: bar += " "
-        return bar
+        cells = self._bar_cells
+        n = len(statuses)
+        # Integer bucketing: cell i shows the status at index i * n // bar_width
+        return "".join([cells.get(statuses[i * n // bar_width], " ") for i in range(bar_width)])
     
-    def get_prefetch_bar(self, statuses: List[str], total_limit: int) -> str:
-        """Generate prefetching progress bar with colors - only shows actual prefetch attempts"""
-        term_width = get_terminal_size()
+    def get_prefetch_bar(self, prefetch_statuses: List[str], total_limit: int, term_width: Optional[int] = None) -> str:
+        """Generate prefetching progress bar with colors - expects only actual prefetch attempts (no cached items)"""
+        if term_width is None:
+            term_width = get_terminal_size()
         bar_width = min(40, term_width - 30)
         if total_limit <= 0: return " " * bar_width
         
-        # Only count items that were actually attempted for prefetching (not cached)
-        prefetch_statuses = [s for s in statuses if s in ['successful', 'failed']]
-        
-        bar = ""
-        for i in range(bar_width):
-            idx = int((i / bar_width) * total_limit) if total_limit > 0 else -1
-            if idx < len(prefetch_statuses):
-                if prefetch_statuses[idx] == 'successful': 
-                    bar += f"{self.COLORS['GREEN']}█{self.COLORS['RESET']}"
-                elif prefetch_statuses[idx] == 'failed': 
-                    bar += f"{self.COLORS['RED']}█{self.COLORS['RESET']}"
-                else: 
-                    bar += " "
-            else: 
-                bar += " "
-        return bar
+        cells = self._bar_cells
+        attempted = len(prefetch_statuses)
+        # Cells past the attempted items stay blank; stop bucketing once we reach them
+        filled = min(bar_width, -(-attempted * bar_width // total_limit))
+        bar = "".join([cells[prefetch_statuses[i * total_limit // bar_width]] for i in range(filled)])
+        return bar + " " * (bar_width - filled)
 
     def get_limits_table(self, **kwargs) -> List[str]:
         """Generates a formatted table of current prefetching limits."""
@@ -108,6 +220,11 @@ class ProgressTracker:
         c_items_limit = kwargs.get('per_catalog_limit', -1)
         cat_mode = kwargs.get('catalog_mode', 'Item')
 
+        # Most redraws (timing refreshes, cached items) leave the counts unchanged
+        key = (g_movies_curr, g_movies_limit, g_series_curr, g_series_limit, c_items_curr, c_items_limit, cat_mode)
+        if key == self._last_limits_key:
+            return self._last_limits_lines
+
         def format_limit(current, limit):
             limit_str = '∞' if limit == -1 else str(limit)
             return f"{current:>4} of {limit_str:<4}"
@@ -119,144 +236,122 @@ class ProgressTracker:
             (limit_name, format_limit(c_items_curr, c_items_limit)),
         ]
 
+        col2_width = max(10, max(len(row[1]) for row in rows))  # 10 = len("Prefetched")
+        layout_key = (limit_name, col2_width)
+        layout = self._limits_table_layouts.get(layout_key)
+        if layout is None:
+            layout = self._limits_table_layouts[layout_key] = self._build_limits_table_layout(limit_name, col2_width)
+        header_lines, row_template, border_bottom = layout
+
+        lines = list(header_lines)
+        for name, value in rows:
+            lines.append(row_template.format(name, value))
+        lines.append(border_bottom)
+        self._last_limits_key = key
+        self._last_limits_lines = lines
+        return lines
+
+    @staticmethod
+    def _build_limits_table_layout(limit_name: str, col2_width: int) -> Tuple[Tuple[str, ...], str, str]:
+        """Build the static parts of the limits table for a given catalog label and value width."""
         headers = ["Limit", "Prefetched"]
-        col1_width = max(len(headers[0]), max(len(row[0]) for row in rows))
-        col2_width = max(len(headers[1]), max(len(row[1]) for row in rows))
+        col1_width = max(len(headers[0]), len("Global Movies"), len("Global Series"), len(limit_name))
         table_width = col1_width + col2_width + 7
 
-        lines = []
         border_top = " " + "‾" * (table_width - 2)
         border_bottom = " " + "—" * (table_width - 2)
-        lines.append(border_top)
-        lines.append(f"| {headers[0]:<{col1_width}} | {headers[1]:^{col2_width}} |")
-        lines.append("|" + "—" * (col1_width + 2) + "|" + "—" * (col2_width + 2) + "|")
-        for name, value in rows:
-            lines.append(f"| {name:<{col1_width}} | {value:^{col2_width}} |")
-        lines.append(border_bottom)
-        return lines
+        header_lines = (
+            border_top,
+            f"| {headers[0]:<{col1_width}} | {headers[1]:^{col2_width}} |",
+            "|" + "—" * (col1_width + 2) + "|" + "—" * (col2_width + 2) + "|",
+        )
+        row_template = f"| {{:<{col1_width}}} | {{:^{col2_width}}} |"
+        return header_lines, row_template, border_bottom
+
+    def _effective_limit(self, at_start: bool, **kwargs) -> int:
+        """How many items the current catalog can prefetch (-1 for unlimited).
+
+        With at_start=True the global counts from when the catalog started are used and
+        nothing prefetched in this catalog is subtracted, giving the catalog's fixed total.
+        """
+        suffix = '_at_start' if at_start else ''
+        catalog_remaining = _remaining(kwargs.get('per_catalog_limit', -1),
+                                       0 if at_start else kwargs.get('prefetched_in_this_catalog', 0))
+        movies_remaining = _remaining(kwargs.get('movies_global_limit', -1),
+                                      kwargs.get('prefetched_movies_count' + suffix, 0))
+        series_remaining = _remaining(kwargs.get('series_global_limit', -1),
+                                      kwargs.get('prefetched_series_count' + suffix, 0))
 
-    def get_catalog_initial_effective_limit(self, **kwargs) -> int:
-        """Calculate the initial effective limit for the current catalog - how many items can be prefetched when starting"""
         cat_mode = kwargs.get('catalog_mode', 'mixed')
-        per_catalog_limit = kwargs.get('per_catalog_limit', -1)
-        
         if cat_mode == 'movie':
-            global_limit = kwargs.get('movies_global_limit', -1)
-            global_current = kwargs.get('prefetched_movies_count_at_start', 0)
+            global_remaining = movies_remaining
         elif cat_mode == 'series':
-            global_limit = kwargs.get('series_global_limit', -1)
-            global_current = kwargs.get('prefetched_series_count_at_start', 0)
-        else:  # mixed
-            # For mixed catalogs, use the more restrictive of the two global limits
-            movies_remaining = kwargs.get('movies_global_limit', -1) - kwargs.get('prefetched_movies_count_at_start', 0) if kwargs.get('movies_global_limit', -1) != -1 else -1
-            series_remaining = kwargs.get('series_global_limit', -1) - kwargs.get('prefetched_series_count_at_start', 0) if kwargs.get('series_global_limit', -1) != -1 else -1
-            
-            if movies_remaining == -1 and series_remaining == -1:
-                global_remaining = -1
-            elif movies_remaining == -1:
-                global_remaining = series_remaining
-            elif series_remaining == -1:
-                global_remaining = movies_remaining
-            else:
-                global_remaining = max(movies_remaining, series_remaining)
-            
-            if per_catalog_limit == -1:
-                return global_remaining
-            elif global_remaining == -1:
-                return per_catalog_limit
-            else:
-                return min(per_catalog_limit, global_remaining)
-        
-        # For movie/series catalogs
-        if global_limit == -1:
-            global_remaining = -1
-        else:
-            global_remaining = max(0, global_limit - global_current)
-        
-        if per_catalog_limit == -1:
-            return global_remaining
-        elif global_remaining == -1:
-            return per_catalog_limit
-        else:
-            return min(per_catalog_limit, global_remaining)
+            global_remaining = series_remaining
+        else:  # mixed - items keep flowing until both global limits are exhausted
+            global_remaining = max(movies_remaining, series_remaining)
+
+        result = min(catalog_remaining, global_remaining)
+        return -1 if result == math.inf else result
+
+    def get_catalog_initial_effective_limit(self, **kwargs) -> int:
+        """Calculate the initial effective limit for the current catalog - how many items can be prefetched when starting"""
+        return self._effective_limit(True, **kwargs)
 
     def get_catalog_effective_limit(self, **kwargs) -> int:
         """Calculate the effective limit for the current catalog - how many items can still be prefetched"""
-        cat_mode = kwargs.get('catalog_mode', 'mixed')
-        per_catalog_limit = kwargs.get('per_catalog_limit', -1)
-        prefetched_in_this_catalog = kwargs.get('prefetched_in_this_catalog', 0)
-        
-        if cat_mode == 'movie':
-            global_limit = kwargs.get('movies_global_limit', -1)
-            global_current = kwargs.get('prefetched_movies_count', 0)
-        elif cat_mode == 'series':
-            global_limit = kwargs.get('series_global_limit', -1)
-            global_current = kwargs.get('prefetched_series_count', 0)
-        else:  # mixed
-            # For mixed catalogs, use the more restrictive of the two global limits
-            movies_remaining = kwargs.get('movies_global_limit', -1) - kwargs.get('prefetched_movies_count', 0) if kwargs.get('movies_global_limit', -1) != -1 else -1
-            series_remaining = kwargs.get('series_global_limit', -1) - kwargs.get('prefetched_series_count', 0) if kwargs.get('series_global_limit', -1) != -1 else -1
-            
-            if movies_remaining == -1 and series_remaining == -1:
-                global_remaining = -1
-            elif movies_remaining == -1:
-                global_remaining = series_remaining
-            elif series_remaining == -1:
-                global_remaining = movies_remaining
-            else:
-                global_remaining = max(movies_remaining, series_remaining)
-            
-            catalog_remaining = per_catalog_limit - prefetched_in_this_catalog if per_catalog_limit != -1 else -1
-            
-            if catalog_remaining == -1:
-                return global_remaining
-            elif global_remaining == -1:
-                return catalog_remaining
-            else:
-                return min(catalog_remaining, global_remaining)
-        
-        # For movie/series catalogs
-        if global_limit == -1:
-            global_remaining = -1
-        else:
-            global_remaining = max(0, global_limit - global_current)
-        
-        catalog_remaining = per_catalog_limit - prefetched_in_this_catalog if per_catalog_limit != -1 else -1
-        
-        if catalog_remaining == -1:
-            return global_remaining
-        elif global_remaining == -1:
-            return catalog_remaining
-        else:
-            return min(catalog_remaining, global_remaining)
+        return self._effective_limit(False, **kwargs)
+
+    def redraw_dashboard(self, force: bool = False, **kwargs):
+        """Redraw the entire dashboard area (throttled unless forced or the mode changes)"""
+        mode = kwargs.get('mode', 'idle')
+        now = time.monotonic()
+        if (not force and mode == self._last_dashboard_mode
+                and now - self._last_dashboard_redraw < self._min_redraw_interval):
+            # Keep the latest state so flush_pending_redraw can show it before slow work starts
+            self._pending_dashboard_kwargs = kwargs
+            return
+        self._render_dashboard(now, **kwargs)
+
+    def flush_pending_redraw(self):
+        """Draw the most recent throttled redraw, if any, so the screen isn't stale during blocking I/O"""
+        kwargs = self._pending_dashboard_kwargs
+        if kwargs is not None:
+            self._render_dashboard(time.monotonic(), **kwargs)
+
+    def _render_dashboard(self, now: float, **kwargs):
+        """Render the dashboard for the given state"""
+        mode = kwargs.get('mode', 'idle')
+        self._pending_dashboard_kwargs = None
+        self._last_dashboard_redraw = now
+        self._last_dashboard_mode = mode
+        term_width = get_terminal_size()
+        bold, reset = self.COLORS['BOLD'], self.COLORS['RESET']
 
-    def redraw_dashboard(self, **kwargs):
-        """Redraw the entire dashboard area"""
-        sys.stdout.write(f"\033[{self.dynamic_lines}A")
-        
         lines = ["", ""]
         
         catalog_statuses = kwargs.get('catalog_statuses', [])
         total_catalogs = kwargs.get('total_catalogs', 0)
         completed = kwargs.get('completed_catalogs', 0)
-        overall_bar = self.get_overall_bar(catalog_statuses, total_catalogs)
+        overall_bar = self.get_overall_bar(catalog_statuses, total_catalogs, term_width)
         progress_pct = f"{(completed / total_catalogs * 100):.1f}%" if total_catalogs > 0 else "0.0%"
         
-        lines.append(f"{self.COLORS['BOLD']}Overall Progress ({completed}/{total_catalogs}):{self.COLORS['RESET']}")
+        lines.append(f"{bold}Overall Progress ({completed}/{total_catalogs}):{reset}")
         lines.append(f"[{overall_bar}] {progress_pct}")
-        lines.append("-" * min(60, get_terminal_size()))
+        lines.append("-" * min(60, term_width))
         lines.extend(["", ""])
         
         catalog_name = kwargs.get('catalog_name', 'Unknown')
         catalog_mode = kwargs.get('catalog_mode', 'Mixed')
         catalog_num = completed + 1
-        lines.append(f"{self.COLORS['BOLD']}Currently Processing Catalog {catalog_num} of {total_catalogs}: {catalog_name} ({catalog_mode.capitalize()}){self.COLORS['RESET']}")
+        lines.append(f"{bold}Currently Processing Catalog {catalog_num} of {total_catalogs}: {catalog_name} ({catalog_mode.capitalize()}){reset}")
         lines.append("")
         
-        mode = kwargs.get('mode', 'idle')
         if mode == 'fetching':
             page_num = kwargs.get('fetched_items', 0)
-            lines.append(f"Fetching Page {page_num}")
+            if kwargs.get('page_prefetched'):
+                lines.append(f"Fetching Page {page_num} (prefetched in background)")
+            else:
+                lines.append(f"Fetching Page {page_num}")
             lines.extend(["", "", ""])
             lines.extend(self.get_limits_table(**kwargs))
             lines.extend(self.get_timing_stats(**kwargs))
@@ -271,7 +366,7 @@ class ProgressTracker:
             initial_effective_limit = self.get_catalog_initial_effective_limit(**kwargs)
             
             # Only count items that were actually attempted for prefetching (not cached)
-            prefetch_statuses = [s for s in statuses if s in ['successful', 'failed']]
+            prefetch_statuses = [s for s in statuses if s == 'successful' or s == 'failed']
             
             if initial_effective_limit == -1:
                 progress_display = f"({len(prefetch_statuses)}/∞)"
@@ -281,8 +376,8 @@ class ProgressTracker:
                 progress_pct = f"{(len(prefetch_statuses) / initial_effective_limit * 100):.1f}%" if initial_effective_limit > 0 else "0.0%"
             
             # Use initial effective limit for both bar rendering AND percentage calculation
-            prefetch_bar = self.get_prefetch_bar(statuses, initial_effective_limit)
-            max_title_len = get_terminal_size()
+            prefetch_bar = self.get_prefetch_bar(prefetch_statuses, initial_effective_limit, term_width)
+            max_title_len = term_width
             display_title = title[:max_title_len-3] + "..." if len(title) > max_title_len else title
             lines.append(f"{display_title}")
             lines.append(f"[{prefetch_bar}] {progress_pct} {progress_display}")
@@ -299,29 +394,25 @@ class ProgressTracker:
             while len(lines) < self.dynamic_lines:
                 lines.append("")
         
-        for line in lines:
-            sys.stdout.write(f"\r\033[K{line}\n")
+        # Move to the top of the dashboard and repaint every line with a single write
+        sys.stdout.write(f"\033[{self.dynamic_lines}A" + "".join([f"{_CLEAR_LINE}{line}\n" for line in lines]))
         sys.stdout.flush()
 
     def get_timing_stats(self, **kwargs) -> List[str]:
         """Generate live timing statistics for the dashboard"""
         start_time = kwargs.get('start_time')
-        movies_prefetched = kwargs.get('prefetched_movies_count', 0)
-        series_prefetched = kwargs.get('prefetched_series_count', 0)
-        movies_limit = kwargs.get('movies_global_limit', -1)
-        series_limit = kwargs.get('series_global_limit', -1)
-        max_execution_time = kwargs.get('max_execution_time', -1)
-        
-        lines = []
         
         if start_time is None:
-            lines.append("")
-            lines.append("")
-            return lines
+            return ["", ""]
         
         current_time = time.time()
         elapsed = current_time - start_time
         
+        # Everything shown changes at most once per displayed second, so reuse the last line until then
+        timing_key = (start_time, int(elapsed))
+        if timing_key == self._last_timing_key:
+            return self._last_timing_lines
+        
         # Format elapsed time
         hours = int(elapsed // 3600)
         minutes = int((elapsed % 3600) // 60)
@@ -334,11 +425,29 @@ class ProgressTracker:
         else:
             elapsed_str = f"{seconds}s"
         
-        # Format start time in 12-hour format
-        dt = datetime.fromtimestamp(start_time, tz=timezone.utc).astimezone()
-        start_str = dt.strftime("%I:%M:%S %p")
+        # Format start time in 12-hour format (fixed for the run, so format it once)
+        if self._cached_start_ts != start_time:
+            dt = datetime.fromtimestamp(start_time, tz=timezone.utc).astimezone()
+            self._start_time_str_cache = dt.strftime("%I:%M:%S %p")
+            self._cached_start_ts = start_time
+        start_str = self._start_time_str_cache
+        
+        eta_str = self._get_eta_string(elapsed, current_time, **kwargs)
+        
+        lines = ["", f"Started: {start_str} | Elapsed: {elapsed_str} | Est. Remaining: {eta_str}"]
+        self._last_timing_key = timing_key
+        self._last_timing_lines = lines
+        return lines
+
+    def _get_eta_string(self, elapsed: float, current_time: float, **kwargs) -> str:
+        """Estimate the remaining run time from the time limit and/or the global item limits"""
+        start_time = kwargs.get('start_time')
+        movies_prefetched = kwargs.get('prefetched_movies_count', 0)
+        series_prefetched = kwargs.get('prefetched_series_count', 0)
+        movies_limit = kwargs.get('movies_global_limit', -1)
+        series_limit = kwargs.get('series_global_limit', -1)
+        max_execution_time = kwargs.get('max_execution_time', -1)
         
-        # Calculate ETA
         eta_str = "Calculating..."
 
         # Check if we have a time limit
@@ -348,19 +457,9 @@ class ProgressTracker:
 
         # Check if we have item limits
         item_based_eta = None
-        if movies_limit != -1 and series_limit != -1 and elapsed > 10:
-            total_items = movies_prefetched + series_prefetched
-            total_target = movies_limit + series_limit
-
-            if total_items > 0 and total_target > 0:
-                rate = total_items / elapsed
-                remaining_items = total_target - total_items
-
-                if remaining_items > 0 and rate > 0:
-                    item_based_eta = remaining_items / rate
-        elif (movies_limit != -1 or series_limit != -1) and elapsed > 10:
-            # At least one limit is set
-            total_items = movies_prefetched + series_prefetched
+        total_items = movies_prefetched + series_prefetched
+        self._update_item_rate(total_items, start_time, current_time)
+        if movies_limit != -1 or series_limit != -1:
             total_target = 0
 
             if movies_limit != -1:
@@ -368,11 +467,11 @@ class ProgressTracker:
             if series_limit != -1:
                 total_target += series_limit
 
-            if total_items > 0 and total_target > 0:
-                rate = total_items / elapsed
+            if self._seconds_per_item_ema and total_target > 0:
+                rate = 1.0 / self._seconds_per_item_ema
                 remaining_items = total_target - total_items
 
-                if remaining_items > 0 and rate > 0:
+                if remaining_items > 0:
                     item_based_eta = remaining_items / rate
 
         # Determine which ETA to use
@@ -407,10 +506,29 @@ class ProgressTracker:
                 else:
                     eta_str = f"{eta_secs}s"
         
-        lines.append("")
-        lines.append(f"Started: {start_str} | Elapsed: {elapsed_str} | Est. Remaining: {eta_str}")
-        
-        return lines
+        return eta_str
+
+    def _update_item_rate(self, total_items: int, start_time: float, now: float):
+        """Fold newly prefetched items into an EMA of seconds per item.
+
+        Only updates when the count changes, so the estimate follows the recent pace
+        instead of being dragged down by the slow start of a long run.
+        """
+        if self._rate_start_ts != start_time:
+            self._rate_start_ts = start_time
+            self._last_item_count = 0
+            self._last_item_ts = start_time
+            self._seconds_per_item_ema = None
+        new_items = total_items - self._last_item_count
+        if new_items <= 0:
+            return
+        interval = (now - self._last_item_ts) / new_items
+        if self._seconds_per_item_ema is None:
+            self._seconds_per_item_ema = interval
+        else:
+            self._seconds_per_item_ema = ETA_EMA_ALPHA * interval + (1 - ETA_EMA_ALPHA) * self._seconds_per_item_ema
+        self._last_item_count = total_items
+        self._last_item_ts = now
 
     def finish_catalog_processing(self, success_count: int, failed_count: int, cached_count: int, **kwargs):
         """Finish catalog processing and update status based on clear rules."""
@@ -420,23 +538,19 @@ class ProgressTracker:
             self.overall_catalogs[self.current_catalog_index]['status'] = status
         completed_catalogs = sum(1 for c in self.overall_catalogs if c['status'] != 'pending')
         catalog_statuses = [c['status'] for c in self.overall_catalogs]
-        self.redraw_dashboard(catalog_statuses=catalog_statuses, completed_catalogs=completed_catalogs, total_catalogs=len(self.overall_catalogs), catalog_name=kwargs.get('catalog_name', "Completed"), mode='idle')
+        self.redraw_dashboard(catalog_statuses=catalog_statuses, completed_catalogs=completed_catalogs, total_catalogs=len(self.overall_catalogs), catalog_name=kwargs.get('catalog_name', "Completed"), mode='idle', force=True)
         self.current_catalog_index += 1
 
     def cleanup_dashboard(self):
         """Clears the entire dynamic dashboard area from the terminal and the initial processing lines."""
-        # Clear dashboard area
-        sys.stdout.write(f"\033[{self.dynamic_lines}A")
-        for _ in range(self.dynamic_lines):
-            sys.stdout.write("\r\033[K\n")
-        sys.stdout.write(f"\033[{self.dynamic_lines}A")
-        
-        # Clear the initial "Starting processing" lines
-        sys.stdout.write(f"\033[{self.initial_lines_printed}A")
-        for _ in range(self.initial_lines_printed):
-            sys.stdout.write("\r\033[K\n")
-        sys.stdout.write(f"\033[{self.initial_lines_printed}A")
-        
+        dashboard_up = f"\033[{self.dynamic_lines}A"
+        initial_up = f"\033[{self.initial_lines_printed}A"
+        sys.stdout.write(
+            # Clear dashboard area
+            dashboard_up + f"{_CLEAR_LINE}\n" * self.dynamic_lines + dashboard_up
+            # Clear the initial "Starting processing" lines
+            + initial_up + f"{_CLEAR_LINE}\n" * self.initial_lines_printed + initial_up
+        )
         sys.stdout.flush()
 
 def parse_addon_urls(arg: str) -> List[Tuple[str, str]]:
@@ -480,8 +594,7 @@ def parse_time_string(time_str: str) -> float:
         return -1
 
     # Extract number and unit
-    import re
-    match = re.match(r'^(-?\d+(?:\.\d+)?)\s*(ms|MS|[smhdwyM]?)$', time_str, re.IGNORECASE)
+    match = _TIME_RE.match(time_str)
     if not match:
         raise argparse.ArgumentTypeError(f"Invalid time format: '{time_str}'. Use format like: 500ms, 30s, 5m (minutes), 2h, 1d, 1w, 1M (months), 1y or -1 (with any unit) for unlimited")
 
@@ -502,18 +615,7 @@ def parse_time_string(time_str: str) -> float:
         raise argparse.ArgumentTypeError(f"Time value must be positive or -1 for unlimited, got: {value}")
 
     # Convert to seconds
-    multipliers = {
-        'ms': 0.001,
-        's': 1,
-        'm': 60,
-        'h': 3600,
-        'd': 86400,
-        'w': 604800,
-        'M': 2592000,  # 30 days
-        'y': 31536000  # 365 days
-    }
-
-    return value * multipliers.get(unit, 1)
+    return value * _TIME_MULTIPLIERS.get(unit, 1)
 
 def format_time_string(seconds: float) -> str:
     """Format seconds back to human-readable string"""
@@ -570,7 +672,7 @@ def format_time_string(seconds: float) -> str:
         return " ".join(parts)
 
 class StreamsPrefetcher:
-    def __init__(self, addon_urls: List[Tuple[str, str]], movies_global_limit: int, series_global_limit: int, movies_per_catalog: int, series_per_catalog: int, items_per_mixed_catalog: int, delay: float, network_request_timeout: int = 30, proxy_url: Optional[str] = None, randomize_catalogs: bool = False, randomize_items: bool = False, cache_validity_seconds: int = 259200, max_execution_time: int = -1, enable_logging: bool = False, cache_uncached_streams_enabled: bool = False, cached_stream_regex: str = '⚡', skip_streams_regex: str = '', max_cache_requests_per_item: int = 1, max_cache_requests_global: int = 50, cached_streams_count_threshold: int = 0, scheduler=None):
+    def __init__(self, addon_urls: List[Tuple[str, str]], movies_global_limit: int, series_global_limit: int, movies_per_catalog: int, series_per_catalog: int, items_per_mixed_catalog: int, delay: float, network_request_timeout: int = 30, proxy_url: Optional[str] = None, randomize_catalogs: bool = False, randomize_items: bool = False, cache_validity_seconds: int = 259200, max_execution_time: int = -1, enable_logging: bool = False, cache_uncached_streams_enabled: bool = False, cached_stream_regex: str = '⚡', skip_streams_regex: str = '', max_cache_requests_per_item: int = 1, max_cache_requests_global: int = 50, cached_streams_count_threshold: int = 0, scheduler=None, sqlite_wal: bool = True):
         self.addon_urls = addon_urls
         self.scheduler = scheduler
         self.movies_global_limit = movies_global_limit
@@ -597,15 +699,20 @@ class StreamsPrefetcher:
         self.cached_streams_count_threshold = cached_streams_count_threshold
         self.cache_requests_sent_count = 0  # Track global count
         self.cache_requests_successful_count = 0  # Track successful cache requests
+        # Stream matchers are built once per run rather than per stream response
+        self._cached_stream_match = None
+        self._skip_stream_match = None
+        if cache_uncached_streams_enabled:
+            self._cached_stream_match = _compile_stream_matcher(cached_stream_regex)
+            if skip_streams_regex and skip_streams_regex.strip():
+                self._skip_stream_match = _compile_stream_matcher(skip_streams_regex)
 
         self.prefetched_movies_count = 0
         self.prefetched_series_count = 0
         self.prefetched_episodes_count = 0
         self.prefetched_cached_count = 0
 
-        # Dashboard auto-refresh throttling
-        self._last_dashboard_redraw = 0.0
-        self._min_redraw_interval = 0.1  # 100ms = max 10 redraws/second
+        # Dashboard auto-refresh (rate limited by ProgressTracker.redraw_dashboard)
         self._is_processing_items = False
         self._current_dashboard_args = None
 
@@ -620,6 +727,7 @@ class StreamsPrefetcher:
         # Initialize logging
         self.log_file = None
         self.log_buffer = []
+        self._last_log_flush = time.monotonic()
         if self.enable_logging:
             self._setup_logging()
         
@@ -633,13 +741,40 @@ class StreamsPrefetcher:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Streams Prefetcher/1.0',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
         })
+        # Reuse pooled connections across requests and retry transient gateway errors.
+        # Stream GETs are themselves cache triggers, so read errors (the request may
+        # already have reached the addon) are never retried, and gateway statuses are
+        # retried for GETs only. Connect errors are retried for every method, since
+        # the request never left. Retry-After is ignored so a 503 can't stall the job.
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                              allowed_methods=frozenset({'GET'}), respect_retry_after_header=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         if self.proxy_url:
             self.session.proxies.update({'http': self.proxy_url, 'https': self.proxy_url})
+        # Earliest monotonic time the next request to each host may start (see _wait_for_request_slot)
+        self._next_request_slot = {}
+        self._request_slot_lock = threading.Lock()
+        # Single worker that fetches the next catalog page while the current one is processed
+        self._page_fetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='catalog-page')
+        # Workers for cache-trigger HEAD requests sent in parallel for a single item
+        self._cache_request_pool = ThreadPoolExecutor(max_workers=CACHE_REQUEST_WORKERS, thread_name_prefix='cache-request')
             
         self.db_conn = None
         self.db_name = "data/db/streams_prefetcher_prefetch_cache.db"
+        self.sqlite_wal = sqlite_wal  # WAL needs shared memory, which network filesystems may not support
+        # Cache rows not yet written, keyed by IMDb ID (flushed in batches)
+        self._pending_cache_writes = {}
+        self._cache_cursor = None
+        # Cache timestamps preloaded for the current page (None = not cached)
+        self._known_cache_timestamps = {}
         self.setup_cache()
 
     def format_timestamp(self, timestamp: Optional[float]) -> str:
@@ -685,7 +820,7 @@ class StreamsPrefetcher:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             log_filename = f"streams_prefetcher_logs_{timestamp}.txt"
             log_path = os.path.join(self.logging_dir, log_filename)
-            self.log_file = open(log_path, 'w', encoding='utf-8')
+            self.log_file = open(log_path, 'w', buffering=65536, encoding='utf-8')
             self._log(f"Logging initialized: {log_path}\n")
         except Exception as e:
             print(f"Warning: Could not setup logging: {e}")
@@ -696,33 +831,39 @@ class StreamsPrefetcher:
         if self.log_file:
             try:
                 self.log_file.write(message + '\n')
-                self.log_file.flush()  # Ensure immediate write
+                # Flush periodically rather than per line; catalog/run boundaries flush explicitly
+                now = time.monotonic()
+                if now - self._last_log_flush >= LOG_FLUSH_INTERVAL:
+                    self.log_file.flush()
+                    self._last_log_flush = now
             except Exception:
                 pass  # Silently fail to not disrupt main functionality
+
+    def flush_log(self):
+        """Push buffered log lines to disk"""
+        if self.log_file:
+            try:
+                self.log_file.flush()
+                self._last_log_flush = time.monotonic()
+            except Exception:
+                pass
     
     def _check_time_limit(self) -> bool:
         """Check if max execution time has been reached"""
         return self.max_execution_time != -1 and (time.time() - self.start_time) >= self.max_execution_time
 
     def _should_auto_redraw(self) -> bool:
-        """Check if enough time has passed for throttled auto-redraw"""
+        """Check if there is an item-processing dashboard to refresh"""
         if not self._is_processing_items:
             self._log(f"[AUTO_REDRAW_DEBUG] Skipped: not processing items")
             return False
         if self._current_dashboard_args is None:
             self._log(f"[AUTO_REDRAW_DEBUG] Skipped: no dashboard args")
             return False
-        current_time = time.time()
-        time_since_last = current_time - self._last_dashboard_redraw
-        if time_since_last >= self._min_redraw_interval:
-            self._last_dashboard_redraw = current_time
-            self._log(f"[AUTO_REDRAW_DEBUG] Allowed: {time_since_last:.3f}s since last redraw (cached_count={self.prefetched_cached_count})")
-            return True
-        self._log(f"[AUTO_REDRAW_DEBUG] Throttled: only {time_since_last:.3f}s since last redraw (need {self._min_redraw_interval:.1f}s)")
-        return False
+        return True
 
     def _auto_redraw_dashboard(self):
-        """Conditionally redraw dashboard with throttling"""
+        """Refresh the dashboard; the progress tracker's throttle decides whether it is drawn"""
         self._log(f"[AUTO_REDRAW_DEBUG] Called with cached_count={self.prefetched_cached_count}")
         if self._should_auto_redraw():
             self._current_dashboard_args['prefetched_cached_count'] = self.prefetched_cached_count
@@ -732,8 +873,7 @@ class StreamsPrefetcher:
             self._log(f"[AUTO_REDRAW_DEBUG] Skipped redraw")
 
     def __del__(self):
-        if self.db_conn:
-            self.db_conn.close()
+        self.close_cache()
         if self.log_file:
             try:
                 self.log_file.close()
@@ -744,8 +884,15 @@ class StreamsPrefetcher:
         """Sets up the SQLite database for caching, adding new columns if needed."""
         try:
             os.makedirs(os.path.dirname(self.db_name), exist_ok=True)
-            self.db_conn = sqlite3.connect(self.db_name, check_same_thread=False)
+            self.db_conn = sqlite3.connect(self.db_name, check_same_thread=False, cached_statements=256)
             cursor = self.db_conn.cursor()
+            # WAL + NORMAL sync: commits no longer fsync the main DB each time
+            # (WAL mode persists in the file, so switch back explicitly when disabled)
+            cursor.execute(f"PRAGMA journal_mode={'WAL' if self.sqlite_wal else 'DELETE'}")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            cursor.execute("PRAGMA mmap_size=268435456")  # Memory-map up to 256 MiB of the DB for reads
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS cache (
                     imdb_id TEXT PRIMARY KEY,
@@ -758,6 +905,7 @@ class StreamsPrefetcher:
             if 'title_name' not in columns:
                 cursor.execute("ALTER TABLE cache ADD COLUMN title_name TEXT")
             self.db_conn.commit()
+            self._cache_cursor = cursor  # Reused for every lookup in is_cache_valid
         except sqlite3.Error as e:
             print(f"SQLite error during cache setup: {e}")
             self.db_conn = None
@@ -765,18 +913,66 @@ class StreamsPrefetcher:
     def is_cache_valid(self, imdb_id: str) -> bool:
         """Checks if an IMDb ID is in the cache and if its timestamp is still valid."""
         if not self.db_conn: return False
-        cursor = self.db_conn.cursor()
-        cursor.execute("SELECT timestamp FROM cache WHERE imdb_id = ?", (imdb_id,))
-        row = cursor.fetchone()
+        if imdb_id in self._pending_cache_writes:
+            return (time.time() - self._pending_cache_writes[imdb_id][1]) < self.cache_validity_seconds
+        if imdb_id in self._known_cache_timestamps:
+            timestamp = self._known_cache_timestamps[imdb_id]
+            return timestamp is not None and (time.time() - timestamp) < self.cache_validity_seconds
+        row = self._cache_cursor.execute(_SQL_CACHE_SELECT, (imdb_id,)).fetchone()
         return row and (time.time() - row[0]) < self.cache_validity_seconds
 
+    def preload_cache_timestamps(self, imdb_ids: List[str], replace: bool = False):
+        """Fetches cache timestamps for many IDs in one query so is_cache_valid can answer from memory.
+
+        With replace=True the previously preloaded IDs are dropped first (used once per catalog page).
+        """
+        if replace:
+            self._known_cache_timestamps = {}
+        if not self.db_conn: return
+        ids = [i for i in dict.fromkeys(imdb_ids) if i and i not in self._known_cache_timestamps]
+        known = self._known_cache_timestamps
+        try:
+            for start in range(0, len(ids), CACHE_LOOKUP_CHUNK_SIZE):
+                chunk = ids[start:start + CACHE_LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                known.update(self._cache_cursor.execute(
+                    f"SELECT imdb_id, timestamp FROM cache WHERE imdb_id IN ({placeholders})", chunk).fetchall())
+                for imdb_id in chunk:
+                    known.setdefault(imdb_id, None)  # Known to be absent from the cache
+        except sqlite3.Error as e:
+            print(f"SQLite error during cache preload: {e}")
+
     def update_cache(self, imdb_id: str, title_name: str):
-        """Updates or inserts an item with its title and the current timestamp in the cache."""
+        """Queues an item with its title and the current timestamp for the cache (written in batches)."""
         if not self.db_conn: return
-        current_time = time.time()
-        cursor = self.db_conn.cursor()
-        cursor.execute("INSERT OR REPLACE INTO cache (imdb_id, timestamp, title_name) VALUES (?, ?, ?)", (imdb_id, current_time, title_name))
-        self.db_conn.commit()
+        now = time.time()
+        self._pending_cache_writes[imdb_id] = (imdb_id, now, title_name)
+        if imdb_id in self._known_cache_timestamps:
+            self._known_cache_timestamps[imdb_id] = now  # Keep the preloaded view current after flushes
+        if len(self._pending_cache_writes) >= CACHE_FLUSH_BATCH_SIZE:
+            self._flush_cache()
+
+    def _flush_cache(self):
+        """Writes all queued cache rows in a single transaction."""
+        if not self.db_conn or not self._pending_cache_writes: return
+        rows = list(self._pending_cache_writes.values())
+        try:
+            with self.db_conn:
+                self.db_conn.executemany(_SQL_CACHE_UPSERT, rows)
+            self._pending_cache_writes.clear()
+        except sqlite3.Error as e:
+            print(f"SQLite error during cache flush: {e}")
+
+    def close_cache(self):
+        """Stops the background request workers, flushes queued cache rows and closes the database connection."""
+        # Runs on cancel and error paths too, so no page fetch or cache request outlives the job
+        self._page_fetcher.shutdown(wait=False, cancel_futures=True)
+        self._cache_request_pool.shutdown(wait=False, cancel_futures=True)
+        if not self.db_conn: return
+        self._flush_cache()
+        self.db_conn.close()
+        self.db_conn = None
+        self._cache_cursor = None
 
     def initialize_results(self) -> Dict[str, Any]:
         return {
@@ -797,12 +993,27 @@ class StreamsPrefetcher:
             }
         }
 
+    def _wait_for_request_slot(self, url: str):
+        """Enforces the configured delay between requests to the same host.
+
+        The wait happens before a request rather than after the previous one, so time spent
+        parsing and processing a response counts toward the delay.
+        """
+        if self.delay <= 0: return
+        host = urlsplit(url).netloc
+        with self._request_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_slot.get(host, 0.0))
+            self._next_request_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
     def make_request(self, url: str) -> Optional[Dict[Any, Any]]:
         try:
+            self._wait_for_request_slot(url)
             response = self.session.get(url, timeout=self.network_request_timeout)
             response.raise_for_status()
-            data = response.json()
-            time.sleep(self.delay)
+            data = _json_loads(response.content)
             return data
         except (requests.exceptions.RequestException, json.JSONDecodeError):
             return None
@@ -811,6 +1022,9 @@ class StreamsPrefetcher:
             if 'response' in locals():
                 response.close()
 
+    def _catalog_page_url(self, catalog_addon_url: str, cat_info: Dict[str, Any], cat_id: str, page: int) -> str:
+        return f"{catalog_addon_url}/catalog/{cat_info.get('type', 'movie')}/{cat_id}/skip={(page-1) * 100}.json"
+
     def get_catalogs(self, catalog_addon_url: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int]:
         manifest = self.make_request(f"{catalog_addon_url}/manifest.json")
         if not manifest or 'catalogs' not in manifest:
@@ -870,13 +1084,13 @@ class StreamsPrefetcher:
             col_widths[2] = max(col_widths[2], len(row[2]))
 
         table_width = sum(col_widths) + 8  # 3 separators of " | " + 2 border chars
+        row_format = f"  | {{:<{col_widths[0]}}} | {{:<{col_widths[1]}}} | {{:<{col_widths[2]}}} |"
 
-        print("  " + "‾" * table_width)
-        print(f"  | {headers[0]:<{col_widths[0]}} | {headers[1]:<{col_widths[1]}} | {headers[2]:<{col_widths[2]}} |")
-        print("  |" + "=" * (col_widths[0] + 2) + "|" + "=" * (col_widths[1] + 2) + "|" + "=" * (col_widths[2] + 2) + "|")
-        for row in all_rows:
-            print(f"  | {row[0]:<{col_widths[0]}} | {row[1]:<{col_widths[1]}} | {row[2]:<{col_widths[2]}} |")
-        print("  " + "_" * table_width)
+        lines = ["  " + "‾" * table_width, row_format.format(*headers),
+                 "  |" + "=" * (col_widths[0] + 2) + "|" + "=" * (col_widths[1] + 2) + "|" + "=" * (col_widths[2] + 2) + "|"]
+        lines.extend([row_format.format(*row) for row in all_rows])
+        lines.append("  " + "_" * table_width)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def extract_imdb_id(self, item: Dict[str, Any]) -> Optional[str]:
         for key in ['imdb_id', 'id']:
@@ -939,38 +1153,35 @@ class StreamsPrefetcher:
         self.results['statistics']['cache_requests_made'] += 1
         response = None
         try:
+            self._wait_for_request_slot(stream_url)
             response = self.session.get(stream_url, timeout=self.network_request_timeout)
             response.raise_for_status()
-            time.sleep(self.delay)
             self.results['statistics']['cache_requests_successful'] += 1
 
-            # Cache uncached streams feature
-            if self.cache_uncached_streams_enabled:
+            # Cache uncached streams feature (skipped outright once no cache request could be sent)
+            if (self.cache_uncached_streams_enabled and self.max_cache_requests_per_item > 0
+                    and self.cache_requests_sent_count < self.max_cache_requests_global):
                 try:
-                    stream_data = response.json()
+                    stream_data = _json_loads(response.content)
                     streams = stream_data.get('streams', [])
 
                     if streams:
-                        # Prepare skip pattern (if configured)
-                        skip_pattern = None
-                        if self.skip_streams_regex and self.skip_streams_regex.strip():
-                            skip_pattern = re.compile(self.skip_streams_regex)
-
+                        # Skip pattern is None when not configured
+                        skip_match = self._skip_stream_match
                         # Count cached streams using regex
-                        cached_pattern = re.compile(self.cached_stream_regex)
+                        cached_match = self._cached_stream_match
                         cached_count = 0
                         uncached_streams = []
 
                         for stream in streams:
                             name = stream.get('name', '')
                             description = stream.get('description', '')
-                            combined_text = f"{name} {description}"
 
                             # Skip streams matching the skip pattern
-                            if skip_pattern and skip_pattern.search(combined_text):
+                            if skip_match and skip_match(name, description):
                                 continue
 
-                            if cached_pattern.search(combined_text):
+                            if cached_match(name, description):
                                 cached_count += 1
                             else:
                                 url = stream.get('url', '')
@@ -994,32 +1205,34 @@ class StreamsPrefetcher:
                                 sys.stdout.write(f"\n🔄 Caching: {title}\n")
                                 sys.stdout.flush()
 
-                            # Try URLs until we get enough successes or run out of attempts
+                            # Try URLs until we get enough successes or run out of attempts. Each round
+                            # sends only as many requests as successes are still missing (in parallel),
+                            # so the per-item goal is never overshot.
                             while (successful_requests < self.max_cache_requests_per_item and
                                    attempts < max_attempts_allowed and
                                    self.cache_requests_sent_count < self.max_cache_requests_global):
 
-                                try:
-                                    head_response = self.session.head(
-                                        uncached_streams[attempts],
-                                        timeout=self.network_request_timeout
-                                    )
-
-                                    # Check if request was successful (2xx status code)
-                                    if 200 <= head_response.status_code < 300:
-                                        successful_requests += 1
-                                        self.cache_requests_successful_count += 1
-
-                                    head_response.close()
-                                    self.cache_requests_sent_count += 1
-                                    attempts += 1
+                                batch_size = min(
+                                    self.max_cache_requests_per_item - successful_requests,
+                                    max_attempts_allowed - attempts,
+                                    self.max_cache_requests_global - self.cache_requests_sent_count,
+                                    CACHE_REQUEST_WORKERS
+                                )
+                                batch = uncached_streams[attempts:attempts + batch_size]
+                                if batch_size == 1:
+                                    results = [self._send_cache_request(batch[0])]
+                                else:
+                                    results = list(self._cache_request_pool.map(self._send_cache_request, batch))
+
+                                succeeded = sum(1 for r in results if r)
+                                successful_requests += succeeded
+                                self.cache_requests_successful_count += succeeded
+                                self.cache_requests_sent_count += len(batch)
+                                attempts += len(batch)
+                                # Failed attempts (no response at all) don't wait before the next URL
+                                if any(r is not None for r in results):
                                     time.sleep(self.delay)
 
-                                except requests.exceptions.RequestException:
-                                    # Failed attempt - count it and try next URL
-                                    self.cache_requests_sent_count += 1
-                                    attempts += 1
-
                 except (json.JSONDecodeError, KeyError):
                     pass  # Silently fail JSON parsing errors
 
@@ -1032,6 +1245,18 @@ class StreamsPrefetcher:
             if response is not None:
                 response.close()
 
+    def _send_cache_request(self, url: str) -> Optional[bool]:
+        """Sends one cache-trigger HEAD request; True for a 2xx response, False otherwise, None on network error."""
+        try:
+            head_response = self.session.head(url, timeout=self.network_request_timeout)
+        except requests.exceptions.RequestException:
+            return None
+        try:
+            # Check if request was successful (2xx status code)
+            return 200 <= head_response.status_code < 300
+        finally:
+            head_response.close()
+
     def get_catalog_mode(self, catalog_info: Dict[str, Any]) -> str:
         cat_type = catalog_info.get('type')
         if cat_type == 'movie': return 'movie'
@@ -1129,6 +1354,7 @@ class StreamsPrefetcher:
 
             page = 0
             success_count, failed_count, cached_count, prefetched_in_this_catalog = 0, 0, 0, 0
+            next_page_future = None  # Background fetch of the page after the one being processed
             
             while True:
                 # Check execution time limit before fetching new page (optimization to avoid unnecessary API call)
@@ -1149,6 +1375,7 @@ class StreamsPrefetcher:
                     catalog_mode=cat_mode,
                     mode='fetching',
                     fetched_items=page,
+                    page_prefetched=next_page_future is not None,
                     prefetched_movies_count=self.prefetched_movies_count,
                     movies_global_limit=self.movies_global_limit,
                     prefetched_series_count=self.prefetched_series_count,
@@ -1160,14 +1387,35 @@ class StreamsPrefetcher:
                     max_execution_time=self.max_execution_time
                 )
                 
-                cat_url = f"{cat_addon_url}/catalog/{cat_info.get('type', 'movie')}/{cat_id}/skip={(page-1) * 100}.json"
-                cat_data = self.make_request(cat_url)
+                if next_page_future is not None:
+                    cat_data = next_page_future.result()
+                    next_page_future = None
+                else:
+                    cat_data = self.make_request(self._catalog_page_url(cat_addon_url, cat_info, cat_id, page))
                 self.results['statistics']['total_pages_fetched'] += 1
                 metas = cat_data.get('metas', []) if cat_data else []
                 if not metas: break
 
+                # Overlap the next page request with processing this page's items, unless
+                # this page alone can use up the remaining limit (then it's likely the last)
+                remaining = self.progress_tracker.get_catalog_effective_limit(
+                    catalog_mode=cat_mode,
+                    per_catalog_limit=per_catalog_limit,
+                    prefetched_in_this_catalog=prefetched_in_this_catalog,
+                    movies_global_limit=self.movies_global_limit,
+                    prefetched_movies_count=self.prefetched_movies_count,
+                    series_global_limit=self.series_global_limit,
+                    prefetched_series_count=self.prefetched_series_count
+                )
+                if (remaining == -1 or remaining > len(metas)) and not self._check_time_limit():
+                    next_page_future = self._page_fetcher.submit(
+                        self.make_request, self._catalog_page_url(cat_addon_url, cat_info, cat_id, page + 1))
+
                 if self.randomize_items: random.shuffle(metas)
 
+                # One cache query for the whole page instead of one per item
+                self.preload_cache_timestamps([self.extract_imdb_id(item) for item in metas], replace=True)
+
                 # Count how many items on this page are already cached vs need prefetching (for verbose logging)
                 if self.enable_logging:
                     page_cached_count = 0
@@ -1188,39 +1436,40 @@ class StreamsPrefetcher:
 
                 self._is_processing_items = True  # Enable auto-refresh
                 item_statuses_on_page = []
+                # Fields fixed for this page; the per-item counters are refreshed in the loop below
+                dashboard_args = {
+                    'catalog_statuses': [c['status'] for c in self.progress_tracker.overall_catalogs],
+                    'completed_catalogs': i,
+                    'total_catalogs': total_to_process,
+                    'catalog_name': cat_name,
+                    'catalog_mode': cat_mode,
+                    'mode': 'prefetching',
+                    'item_statuses': item_statuses_on_page,
+                    'total_items': len(metas),
+                    'movies_global_limit': self.movies_global_limit,
+                    'series_global_limit': self.series_global_limit,
+                    'per_catalog_limit': per_catalog_limit,
+                    'prefetched_movies_count_at_start': initial_movies_count,
+                    'prefetched_series_count_at_start': initial_series_count,
+                    'start_time': self.processing_start,
+                    'max_execution_time': self.max_execution_time
+                }
                 for item in metas:
                     # Check if paused BEFORE starting new item (wait if paused)
                     if self.scheduler:
-                        self.scheduler.pause_event.wait()  # Blocks if paused, returns immediately if not
+                        self.scheduler.wait_if_paused()  # Blocks if paused, raises KeyboardInterrupt if cancelled
 
                     if per_catalog_limit != -1 and prefetched_in_this_catalog >= per_catalog_limit: break
                     item_type = item.get('type')
                     if item_type == 'movie' and self.movies_global_limit != -1 and self.prefetched_movies_count >= self.movies_global_limit: continue
                     if item_type == 'series' and self.series_global_limit != -1 and self.prefetched_series_count >= self.series_global_limit: continue
 
-                    dashboard_args = {
-                        'catalog_statuses': [c['status'] for c in self.progress_tracker.overall_catalogs],
-                        'completed_catalogs': i,
-                        'total_catalogs': total_to_process,
-                        'catalog_name': cat_name,
-                        'catalog_mode': cat_mode,
-                        'mode': 'prefetching',
-                        'item_statuses': item_statuses_on_page,
-                        'total_items': len(metas),
-                        'prefetched_movies_count': self.prefetched_movies_count,
-                        'movies_global_limit': self.movies_global_limit,
-                        'prefetched_series_count': self.prefetched_series_count,
-                        'series_global_limit': self.series_global_limit,
-                        'prefetched_cached_count': self.prefetched_cached_count,
-                        'prefetched_in_this_catalog': prefetched_in_this_catalog,
-                        'per_catalog_limit': per_catalog_limit,
-                        'prefetched_movies_count_at_start': initial_movies_count,
-                        'prefetched_series_count_at_start': initial_series_count,
-                        'catalog_movies_count': self.prefetched_movies_count - initial_movies_count,
-                        'catalog_series_count': self.prefetched_series_count - initial_series_count,
-                        'start_time': self.processing_start,
-                        'max_execution_time': self.max_execution_time
-                    }
+                    dashboard_args['prefetched_movies_count'] = self.prefetched_movies_count
+                    dashboard_args['prefetched_series_count'] = self.prefetched_series_count
+                    dashboard_args['prefetched_cached_count'] = self.prefetched_cached_count
+                    dashboard_args['prefetched_in_this_catalog'] = prefetched_in_this_catalog
+                    dashboard_args['catalog_movies_count'] = self.prefetched_movies_count - initial_movies_count
+                    dashboard_args['catalog_series_count'] = self.prefetched_series_count - initial_series_count
 
                     if item_type == 'movie':
                         imdb_id, title = self.extract_imdb_id(item), self.get_title_from_item(item)
@@ -1240,17 +1489,15 @@ class StreamsPrefetcher:
                             continue
 
                         # Check if pause was requested BEFORE prefetching (after showing UI)
-                        if self.scheduler and self.scheduler.pause_requested:
-                            # UI already shows this item (poster, name, etc.)
-                            # Now pause before prefetching it
-                            self.scheduler.complete_pause()
-                            # This will block here until resumed
-                            self.scheduler.pause_event.wait()
+                        # UI already shows this item (poster, name, etc.) - blocks here until resumed
+                        if self.scheduler:
+                            self.scheduler.check_pause()
 
                         # Check time limit before starting HTTP request
                         if self._check_time_limit():
                             break
 
+                        self.progress_tracker.flush_pending_redraw()
                         if self.prefetch_streams(imdb_id, 'movie', title):
                             self.update_cache(imdb_id, title)
                             success_count += 1; prefetched_in_this_catalog += 1; self.prefetched_movies_count += 1
@@ -1268,16 +1515,15 @@ class StreamsPrefetcher:
                         if not series_imdb_id: failed_count += 1; item_statuses_on_page.append('failed'); continue
 
                         # Check if pause was requested BEFORE prefetching (after showing UI)
-                        if self.scheduler and self.scheduler.pause_requested:
-                            # UI already shows this series (poster, name, etc.)
-                            # Now pause before prefetching it
-                            self.scheduler.complete_pause()
-                            # This will block here until resumed
-                            self.scheduler.pause_event.wait()
+                        # UI already shows this series (poster, name, etc.) - blocks here until resumed
+                        if self.scheduler:
+                            self.scheduler.check_pause()
 
+                        self.progress_tracker.flush_pending_redraw()
                         episodes = self.get_series_episodes(series_imdb_id, cat_addon_url)
                         if not episodes: failed_count += 1; item_statuses_on_page.append('failed'); continue
                         self.results['statistics']['episodes_found'] += len(episodes)
+                        self.preload_cache_timestamps([ep['id'] for ep in episodes])
                         cached_episodes = sum(1 for ep in episodes if self.is_cache_valid(ep['id']))
                         if (cached_episodes / len(episodes)) >= 0.75:
                             cached_count += 1
@@ -1290,7 +1536,7 @@ class StreamsPrefetcher:
                         for ep in episodes:
                             # Check if paused BEFORE starting new episode (wait if paused)
                             if self.scheduler:
-                                self.scheduler.pause_event.wait()  # Blocks if paused, returns immediately if not
+                                self.scheduler.wait_if_paused()  # Blocks if paused, raises KeyboardInterrupt if cancelled
 
                             if self.is_cache_valid(ep['id']): continue
 
@@ -1304,17 +1550,15 @@ class StreamsPrefetcher:
                             )
 
                             # Check if pause was requested BEFORE prefetching (after showing UI)
-                            if self.scheduler and self.scheduler.pause_requested:
-                                # UI already shows this episode (poster, name, etc.)
-                                # Now pause before prefetching it
-                                self.scheduler.complete_pause()
-                                # This will block here until resumed
-                                self.scheduler.pause_event.wait()
+                            # UI already shows this episode (poster, name, etc.) - blocks here until resumed
+                            if self.scheduler:
+                                self.scheduler.check_pause()
 
                             # Check time limit before starting HTTP request
                             if self._check_time_limit():
                                 break
 
+                            self.progress_tracker.flush_pending_redraw()
                             if self.prefetch_streams(ep['id'], 'series', ep_title):
                                self.update_cache(ep['id'], ep_title); series_had_success = True; self.prefetched_episodes_count += 1
 
@@ -1324,6 +1568,11 @@ class StreamsPrefetcher:
                         else: failed_count += 1; item_statuses_on_page.append('failed')
 
                 self._is_processing_items = False  # Disable auto-refresh
+                self._flush_cache()  # Commit this page's cache rows in one transaction
+
+            if next_page_future is not None:
+                # A limit stopped this catalog early; the prefetched page is not needed
+                next_page_future.cancel()
 
             catalog_end_time = time.time()
             catalog_duration = catalog_end_time - catalog_start_time
@@ -1349,6 +1598,7 @@ class StreamsPrefetcher:
             
             self.results['statistics']['cached_count'] += cached_count
             self.progress_tracker.finish_catalog_processing(success_count, failed_count, cached_count, catalog_name=cat_name)
+            self.flush_log()
             
             # Check execution time limit after each catalog
             if self._check_time_limit():
@@ -1525,6 +1775,7 @@ class StreamsPrefetcher:
         final_msg = "\nYour Stremio addon cache has been warmed up!\nContent should now load faster when you browse in Stremio. ✨"
         print(final_msg)
         self._log(final_msg)
+        self.flush_log()
 
 def main():
     parser = argparse.ArgumentParser(description='Prefetch streams from a Stremio addon for faster loading.', formatter_class=argparse.RawDescriptionHelpFormatter, epilog='''
@@ -1551,6 +1802,7 @@ Examples:
     parser.add_argument('--cache-validity', type=parse_time_string, default='3d', help='Validity of cached items. Format: 30s, 5m (minutes), 2h, 3d, 1w, 1M (months), 1y. (default: 3d)')
     parser.add_argument('-t', '--max-execution-time', type=parse_time_string, default='-1s', help='Maximum execution time. Format: 30s, 5m (minutes), 2h, 1d, 1w, 1M (months), 1y or -1 (with any unit) for unlimited. (default: -1s)')
     parser.add_argument('--enable-logging', action='store_true', help='Enable logging. Creates timestamped log files in data/logs directory with full execution details.')
+    parser.add_argument('--sqlite-no-wal', action='store_true', help='Disable SQLite WAL journaling for the prefetch cache (use on NFS or other network filesystems).')
     
     args = parser.parse_args()
     
@@ -1577,7 +1829,7 @@ Examples:
         print(f"  {param:<28}: {value}")
     print("-" * terminal_width)
 
-    prefetcher = StreamsPrefetcher(args.addon_urls, movies_global_limit=args.movies_global_limit, series_global_limit=args.series_global_limit, movies_per_catalog=args.movies_per_catalog, series_per_catalog=args.series_per_catalog, items_per_mixed_catalog=args.items_per_mixed_catalog, delay=args.delay, proxy_url=args.proxy, randomize_catalogs=args.randomize_catalog_processing, randomize_items=args.randomize_item_prefetching, cache_validity_seconds=args.cache_validity, max_execution_time=args.max_execution_time, enable_logging=args.enable_logging)
+    prefetcher = StreamsPrefetcher(args.addon_urls, movies_global_limit=args.movies_global_limit, series_global_limit=args.series_global_limit, movies_per_catalog=args.movies_per_catalog, series_per_catalog=args.series_per_catalog, items_per_mixed_catalog=args.items_per_mixed_catalog, delay=args.delay, proxy_url=args.proxy, randomize_catalogs=args.randomize_catalog_processing, randomize_items=args.randomize_item_prefetching, cache_validity_seconds=args.cache_validity, max_execution_time=args.max_execution_time, enable_logging=args.enable_logging, sqlite_wal=not args.sqlite_no_wal)
     
     try:
         results = prefetcher.process_all()
@@ -1594,7 +1846,7 @@ Examples:
         prefetcher.progress_tracker.cleanup_dashboard()
         return 1
     finally:
-        if prefetcher.db_conn: prefetcher.db_conn.close()
+        prefetcher.close_cache()
 
 if __name__ == "__main__":
     sys.exit(main())
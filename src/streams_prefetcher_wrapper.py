@@ -19,9 +19,11 @@ class StreamsPrefetcherWrapper:
         config_manager: ConfigManager,
         scheduler = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
-        output_callback: Optional[Callable[[str], None]] = None
+        output_callback: Optional[Callable[[str], None]] = None,
+        config: Optional[Dict[str, Any]] = None
     ):
         self.config_manager = config_manager
+        self.config = config  # Pre-read config snapshot (read from config_manager if None)
         self.scheduler = scheduler
         self.progress_callback = progress_callback
         self.output_callback = output_callback
@@ -29,7 +31,7 @@ class StreamsPrefetcherWrapper:
 
     def _parse_config_to_args(self) -> Dict[str, Any]:
         """Parse configuration into arguments for StreamsPrefetcher"""
-        config = self.config_manager.get_all()
+        config = self.config if self.config is not None else self.config_manager.get_all()
 
         # Get saved catalogs (filtered by enabled state)
         saved_catalogs = config.get('saved_catalogs', [])
@@ -84,6 +86,7 @@ class StreamsPrefetcherWrapper:
             'cache_validity_seconds': config.get('cache_validity', 259200),
             'max_execution_time': config.get('max_execution_time', -1),
             'enable_logging': config.get('enable_logging', False),
+            'sqlite_wal': config.get('sqlite_wal', True),
             'cache_uncached_streams_enabled': cache_uncached_streams.get('enabled', False),
             'cached_stream_regex': cache_uncached_streams.get('cached_stream_regex', '⚡'),
             'skip_streams_regex': cache_uncached_streams.get('skip_streams_regex', ''),
@@ -137,8 +140,9 @@ class StreamsPrefetcherWrapper:
             return {'success': False, 'error': str(e), 'results': results}
 
         finally:
-            if self.prefetcher and self.prefetcher.db_conn:
-                self.prefetcher.db_conn.close()
+            if self.prefetcher:
+                self.prefetcher.close_cache()
+                self.prefetcher.flush_log()
 
     def _wrap_progress_tracker(self):
         """Wrap progress tracker methods to provide callbacks"""
@@ -223,8 +223,9 @@ def update_config():
                 'error': 'Validation failed: ' + '; '.join(validation_errors)
             }), 400
 
-        # Update configuration
-        success = config_manager.update(data)
+        # Update configuration and write it now so save failures are reported
+        config_manager.update(data)
+        success = config_manager.flush()
 
         if success:
             return jsonify({'success': True, 'config': config_manager.get_all()})
@@ -401,9 +402,9 @@ def save_catalog_selection():
             logger.info(f"[CATALOG SAVE] ... and {len(catalogs) - 3} more catalogs")
 
         # Save full catalog data (not just selection)
-        logger.info("[CATALOG SAVE] Calling config_manager.set('saved_catalogs', ...)")
-        success = config_manager.set('saved_catalogs', catalogs)
-        logger.info(f"[CATALOG SAVE] config_manager.set returned: {success}")
+        logger.info("[CATALOG SAVE] Calling config_manager.set_immediate('saved_catalogs', ...)")
+        success = config_manager.set_immediate('saved_catalogs', catalogs)
+        logger.info(f"[CATALOG SAVE] config_manager.set_immediate returned: {success}")
 
         if success:
             # Verify the save by reading back
@@ -412,7 +413,7 @@ def save_catalog_selection():
             logger.info("[CATALOG SAVE] ✓ Save successful!")
             return jsonify({'success': True})
         else:
-            logger.error("[CATALOG SAVE] ✗ config_manager.set returned False")
+            logger.error("[CATALOG SAVE] ✗ config_manager.set_immediate returned False")
             return jsonify({'success': False, 'error': 'Failed to save catalog selection'}), 500
 
     except Exception as e: